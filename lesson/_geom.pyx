@@ -0,0 +1,23 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional Cython-compiled geometry helpers for tank_game.py.
+
+Build in place with:
+
+    pip install cython
+    cythonize -3 -i lesson/_geom.pyx
+
+tank_game.py falls back to its pure-Python versions when this extension
+has not been built, so compiling it is never required - just faster.
+The typed cpdef skips per-call argument boxing and runs the whole
+squared-distance comparison in C doubles.
+"""
+
+
+cpdef bint check_circle_collision(double x1, double y1, double r1,
+                                  double x2, double y2, double r2):
+    """Return True if two circles overlap (squared-distance test)."""
+    cdef double dx = x2 - x1
+    cdef double dy = y2 - y1
+    cdef double radius_sum = r1 + r2
+    return dx * dx + dy * dy < radius_sum * radius_sum
@@ -18,6 +18,14 @@ Controls:
 - SPACE: Fire bullet
 - R: Restart (when game over)
 
+Runs on PyPy as well as CPython. The game loop is deliberately shaped
+to keep PyPy's tracing JIT happy: restarting resets state inside a flat
+loop instead of recursing into main(), dead objects are filtered with
+set-based rebuilds rather than list.remove() inside iteration, and the
+hot path contains no exception handling or isinstance dispatch. NumPy
+and Numba are skipped automatically where unavailable, so the pure
+PyPy path exercises only plain Python objects.
+
 Author: Code the Dream Python Essentials
 Date: November 2024
 """
@@ -27,9 +35,33 @@ import random
 import math
 from typing import List, Tuple
 
+# NumPy is optional (but recommended - see requirements.txt). When it's
+# available we store bullets as contiguous arrays and update them all at
+# once in C instead of looping in Python. The game works without it.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Numba is also optional: if installed, the bullet-vs-enemy collision
+# kernel below gets JIT-compiled to machine code the first time it runs
+# (and cached on disk for later runs). Without it, the spatial-grid
+# Python path in main() is used instead.
+try:
+    import numba
+except ImportError:
+    numba = None
+
 # Initialize pygame
 pygame.init()
 
+# We only ever react to window-close and key-press events, so block
+# everything else (mouse motion in particular fires constantly). Blocked
+# events are never even created, which keeps the per-frame event queue
+# empty instead of allocating dozens of Event objects we'd just discard.
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+
 # Constants
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 800
@@ -43,6 +75,66 @@ ENEMY_SPEED = 2
 OBSTACLE_SIZE = 50
 FPS = 60 # May need adjustment for slower machines
 
+# Trig lookup tables
+# Tanks and enemies rotate in whole-degree steps, so instead of calling
+# math.cos/math.sin (plus math.radians) every frame, we compute all 360
+# values ONCE at startup and just look them up. A tuple index is far
+# cheaper than recomputing the same trig result thousands of times.
+COS_DEG: Tuple[float, ...] = tuple(math.cos(math.radians(a)) for a in range(360))
+SIN_DEG: Tuple[float, ...] = tuple(math.sin(math.radians(a)) for a in range(360))
+
+
+def _dir(angle: float) -> Tuple[float, float]:
+    """
+    Get the (cos, sin) direction vector for an angle in degrees.
+
+    Uses the precomputed lookup tables above - angles are always
+    whole degrees in this game, so no precision is lost.
+    """
+    i = int(angle) % 360
+    return COS_DEG[i], SIN_DEG[i]
+
+
+# Enemy AI direction tables
+# Enemies only face the four cardinal directions, so wall bounces can be
+# a dict lookup instead of arithmetic like `180 - direction` (which can
+# also go negative). The tables map current direction -> reflected
+# direction for horizontal and vertical walls respectively.
+CARDINAL_DIRECTIONS = (0, 90, 180, 270)
+H_REFLECT = {0: 180, 90: 90, 180: 0, 270: 270}
+V_REFLECT = {0: 0, 90: 270, 180: 180, 270: 90}
+
+# Integer unit steps for the cardinal directions (screen coordinates,
+# so +y is down). Enemies only ever move along these, which lets their
+# positions stay exact integers: no float drift at the walls, and
+# integer adds are the cheapest arithmetic the interpreter has.
+CARDINAL_STEP = {0: (1, 0), 90: (0, 1), 180: (-1, 0), 270: (0, -1)}
+
+# Batched random numbers for the enemy direction timer. random.randint
+# walks through several layers of pure-Python plumbing (randrange,
+# getrandbits, a modulo) on every call; drawing 1024 values at once -
+# with NumPy's generator when available - amortizes that cost to almost
+# nothing per call. The 60-120 frame range matches the only caller.
+_RAND_LO, _RAND_HI = 60, 120
+if np is not None:
+    _rand_gen = np.random.default_rng()
+
+    def _refill_rand_cache() -> List[int]:
+        return _rand_gen.integers(_RAND_LO, _RAND_HI + 1, size=1024).tolist()
+else:
+    def _refill_rand_cache() -> List[int]:
+        randint = random.randint
+        return [randint(_RAND_LO, _RAND_HI) for _ in range(1024)]
+
+_rand_cache: List[int] = []
+
+
+def fast_randint() -> int:
+    """Next random enemy-timer delay in [60, 120], from the cached batch."""
+    if not _rand_cache:
+        _rand_cache.extend(_refill_rand_cache())
+    return _rand_cache.pop()
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -57,8 +149,60 @@ screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Tank Battle")
 clock = pygame.time.Clock()
 
+
+# Pre-rendered sprites
+# Every pygame.draw.* call is a Python-to-C transition; drawing each
+# tank/enemy/bullet shape-by-shape every frame adds up fast. Instead we
+# render each entity ONCE into a small transparent surface and just blit
+# it afterwards. Rotated variants are cached per whole-degree angle the
+# first time that angle is seen.
+
+def _render_body_sprite(color: Tuple[int, int, int], size: int,
+                        cannon_length: int, cannon_width: int) -> pygame.Surface:
+    """Render a tank-style body (circle + cannon facing angle 0)."""
+    half = cannon_length + 2
+    surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surf, color, (half, half), size)
+    pygame.draw.line(surf, WHITE, (half, half), (half + cannon_length, half),
+                     cannon_width)
+    return surf
+
+
+def _rotated_sprite(cache: dict, base: pygame.Surface, angle: int) -> pygame.Surface:
+    """Fetch (or build and cache) the base sprite rotated to `angle` degrees."""
+    sprite = cache.get(angle)
+    if sprite is None:
+        # Negative because pygame rotates counter-clockwise while our
+        # angles go clockwise (y axis points down on screen)
+        sprite = pygame.transform.rotate(base, -angle)
+        cache[angle] = sprite
+    return sprite
+
+
+def _render_bullet_sprite() -> pygame.Surface:
+    """Render the shared bullet sprite (a small yellow circle)."""
+    surf = pygame.Surface((BULLET_SIZE * 2, BULLET_SIZE * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surf, YELLOW, (BULLET_SIZE, BULLET_SIZE), BULLET_SIZE)
+    return surf
+
+
+_BULLET_SPRITE = _render_bullet_sprite()
+
 class Tank:
     """Player-controlled tank class."""
+
+    # __slots__ replaces the per-instance __dict__ with fixed storage:
+    # attribute access gets faster and each instance shrinks by ~100
+    # bytes - worthwhile for objects touched many times per frame.
+    __slots__ = ('x', 'y', 'color', 'angle', 'speed', 'rotation_speed',
+                 'size', 'health', 'score', 'bullets', 'last_shot',
+                 'shot_delay')
+
+    # Shared sprite caches: base sprite per color, rotated variants per
+    # (color, angle). Class-level so every tank of a color shares them.
+    _base_sprites: dict = {}
+    _rotated_sprites: dict = {}
+
     def __init__(self, x: int, y: int, color: Tuple[int, int, int]) -> None:
         self.x = x
         self.y = y
@@ -80,8 +224,9 @@ class Tank:
         Uses trigonometry: if we're facing at angle θ,
         moving forward means adding cos(θ) to x and sin(θ) to y.
         """
-        self.x += math.cos(math.radians(self.angle)) * self.speed
-        self.y += math.sin(math.radians(self.angle)) * self.speed
+        dx, dy = _dir(self.angle)
+        self.x += dx * self.speed
+        self.y += dy * self.speed
         self._keep_on_screen()  # Don't let tank escape!
     
     def move_backward(self) -> None:
@@ -90,8 +235,9 @@ class Tank:
         
         Same math as forward, but we subtract instead of add.
         """
-        self.x -= math.cos(math.radians(self.angle)) * self.speed
-        self.y -= math.sin(math.radians(self.angle)) * self.speed
+        dx, dy = _dir(self.angle)
+        self.x -= dx * self.speed
+        self.y -= dy * self.speed
         self._keep_on_screen()
     
     def rotate_left(self) -> None:
@@ -114,9 +260,25 @@ class Tank:
         """
         # Calculate bullet starting position (at end of cannon)
         cannon_length: int = self.size + 15
-        start_x: float = self.x + math.cos(math.radians(self.angle)) * cannon_length
-        start_y: float = self.y + math.sin(math.radians(self.angle)) * cannon_length
+        dx, dy = _dir(self.angle)
+        start_x: float = self.x + dx * cannon_length
+        start_y: float = self.y + dy * cannon_length
         return Bullet(start_x, start_y, self.angle)
+
+    def shoot_into(self, pool: "BulletPool") -> None:
+        """
+        Fire a bullet directly into the shared bullet pool.
+
+        Same as shoot(), but writes into the pool's arrays instead of
+        allocating a Bullet object - this is what the game loop uses.
+        """
+        cannon_length: int = self.size + 15
+        dx, dy = _dir(self.angle)
+        pool.spawn(
+            self.x + dx * cannon_length,
+            self.y + dy * cannon_length,
+            self.angle,
+        )
     
     def _keep_on_screen(self) -> None:
         """
@@ -130,29 +292,24 @@ class Tank:
         """
         # max() ensures we're not less than the minimum
         # min() ensures we're not more than the maximum
-        self.x = max(self.size, min(WINDOW_WIDTH - self.size, self.x))
-        self.y = max(self.size, min(WINDOW_HEIGHT - self.size, self.y))
+        # (size is read once into a local - attribute lookups add up
+        # when this runs every frame the tank moves)
+        size = self.size
+        self.x = max(size, min(WINDOW_WIDTH - size, self.x))
+        self.y = max(size, min(WINDOW_HEIGHT - size, self.y))
     
-    def draw(self, surface: pygame.Surface) -> None:
-        """Draw the tank with a body and cannon."""
-        # Draw tank body
-        pygame.draw.circle(
-            surface,
-            self.color,
-            (int(self.x), int(self.y)),
-            self.size
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        """Draw the tank (a cached pre-rendered sprite, one blit)."""
+        base = Tank._base_sprites.get(self.color)
+        if base is None:
+            base = _render_body_sprite(self.color, self.size, self.size + 15, 5)
+            Tank._base_sprites[self.color] = base
+            Tank._rotated_sprites[self.color] = {}
+        sprite = _rotated_sprite(
+            Tank._rotated_sprites[self.color], base, int(self.angle) % 360
         )
-        
-        # Draw cannon
-        cannon_length = self.size + 15
-        end_x = self.x + math.cos(math.radians(self.angle)) * cannon_length
-        end_y = self.y + math.sin(math.radians(self.angle)) * cannon_length
-        pygame.draw.line(
-            surface,
-            WHITE,
-            (int(self.x), int(self.y)),
-            (int(end_x), int(end_y)),
-            5
+        return surface.blit(
+            sprite, sprite.get_rect(center=(int(self.x), int(self.y)))
         )
 
 
@@ -171,7 +328,9 @@ class Bullet:
       
   color: RGB tuple for bullet color
     """
-    
+
+    __slots__ = ('x', 'y', 'angle', 'speed', 'radius', 'color')
+
     def __init__(self, x: float, y: float, angle: float) -> None:
         """
         Create a bullet at position, traveling in direction of angle.
@@ -194,8 +353,9 @@ class Bullet:
         
         Called once per game loop iteration to advance the bullet.
         """
-        self.x += math.cos(math.radians(self.angle)) * self.speed
-        self.y += math.sin(math.radians(self.angle)) * self.speed
+        dx, dy = _dir(self.angle)
+        self.x += dx * self.speed
+        self.y += dy * self.speed
     
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the bullet as a small circle."""
@@ -209,7 +369,10 @@ class Bullet:
     def is_off_screen(self) -> bool:
         """
         Check if bullet has left the play area.
-        
+
+        Note: the main loop inlines this check for speed; this method
+        is kept for external callers and readability.
+
         Returns:
             True if bullet is outside window bounds, False otherwise.
         """
@@ -218,6 +381,132 @@ class Bullet:
                 self.y < 0 or 
                 self.y > WINDOW_HEIGHT)
 
+class BulletPool:
+    """
+    Structure-of-arrays storage for every live bullet.
+
+    Instead of a list of Bullet objects (an "array of structs"), we keep
+    parallel arrays: x[i], y[i], vx[i], vy[i] together describe bullet i.
+    Velocity is computed ONCE when the bullet is fired, so each frame's
+    update is just x += vx, y += vy.
+
+    With NumPy installed, that update (and the off-screen/obstacle cull)
+    runs over all bullets in a couple of C-level array operations - no
+    per-bullet Python loop at all. Without NumPy, or when only a handful
+    of bullets are live (NumPy's fixed per-call overhead only pays off
+    for bigger batches), a plain scalar loop over the arrays is used.
+    """
+
+    BATCH_MIN = 32  # Below this count the scalar loop beats NumPy overhead
+
+    __slots__ = ('capacity', 'count', 'x', 'y', 'vx', 'vy')
+
+    def __init__(self, capacity: int = 256) -> None:
+        """Pre-allocate storage for up to `capacity` bullets."""
+        self.capacity = capacity
+        self.count = 0
+        if np is not None:
+            self.x = np.empty(capacity, dtype=np.float32)
+            self.y = np.empty(capacity, dtype=np.float32)
+            self.vx = np.empty(capacity, dtype=np.float32)
+            self.vy = np.empty(capacity, dtype=np.float32)
+        else:
+            self.x = [0.0] * capacity
+            self.y = [0.0] * capacity
+            self.vx = [0.0] * capacity
+            self.vy = [0.0] * capacity
+
+    def spawn(self, x: float, y: float, angle: float) -> None:
+        """Add a bullet at (x, y) traveling in direction `angle` (degrees)."""
+        if self.count >= self.capacity:
+            return  # Pool full - drop the shot rather than grow
+        i = self.count
+        d = int(angle) % 360
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = BULLET_SPEED * COS_DEG[d]
+        self.vy[i] = BULLET_SPEED * SIN_DEG[d]
+        self.count += 1
+
+    def update_and_cull(self, obstacles: List["Obstacle"]) -> None:
+        """
+        Move every bullet one step, dropping any that leave the screen
+        or hit an obstacle. Surviving bullets are compacted to the front
+        of the arrays so indices 0..count-1 are always live.
+        """
+        n = self.count
+        if n == 0:
+            return
+        if np is not None and n >= self.BATCH_MIN:
+            # Vectorized path: two adds move everything, one boolean
+            # mask handles the whole cull.
+            x = self.x[:n]
+            y = self.y[:n]
+            x += self.vx[:n]
+            y += self.vy[:n]
+            alive = (x >= 0) & (x <= WINDOW_WIDTH) & (y >= 0) & (y <= WINDOW_HEIGHT)
+            r_sq = BULLET_SIZE * BULLET_SIZE
+            for obs in obstacles:
+                rect = obs.rect
+                # Closest point on the rectangle to each bullet center
+                cx = np.clip(x, rect.left, rect.right)
+                cy = np.clip(y, rect.top, rect.bottom)
+                alive &= (x - cx) ** 2 + (y - cy) ** 2 >= r_sq
+            m = int(alive.sum())
+            if m != n:
+                for arr in (self.x, self.y, self.vx, self.vy):
+                    arr[:m] = arr[:n][alive]
+                self.count = m
+        else:
+            # Scalar path: same logic, one fused pass over the arrays
+            ww, wh = WINDOW_WIDTH, WINDOW_HEIGHT
+            x, y, vx, vy = self.x, self.y, self.vx, self.vy
+            m = 0
+            for i in range(n):
+                bx = x[i] + vx[i]
+                by = y[i] + vy[i]
+                if bx < 0 or bx > ww or by < 0 or by > wh:
+                    continue
+                hit = False
+                for obs in obstacles:
+                    if check_circle_rect_collision(bx, by, BULLET_SIZE, obs.rect):
+                        hit = True
+                        break
+                if hit:
+                    continue
+                x[m] = bx
+                y[m] = by
+                vx[m] = vx[i]
+                vy[m] = vy[i]
+                m += 1
+            self.count = m
+
+    def kill(self, indices: set) -> None:
+        """Remove the bullets at the given indices, compacting the pool."""
+        if not indices:
+            return
+        m = 0
+        for i in range(self.count):
+            if i in indices:
+                continue
+            if m != i:
+                self.x[m] = self.x[i]
+                self.y[m] = self.y[i]
+                self.vx[m] = self.vx[i]
+                self.vy[m] = self.vy[i]
+            m += 1
+        self.count = m
+
+    def draw(self, surface: pygame.Surface) -> List[pygame.Rect]:
+        """Draw every live bullet with one batched blits() call."""
+        x, y = self.x, self.y
+        r = BULLET_SIZE
+        return surface.blits(
+            [(_BULLET_SPRITE, (int(x[i]) - r, int(y[i]) - r))
+             for i in range(self.count)]
+        )
+
+
 class Obstacle:
     """
     A wall/barrier that blocks movement and bullets.
@@ -229,7 +518,9 @@ class Obstacle:
         rect: Pygame Rect object storing position and dimensions
         color: RGB tuple for obstacle color
     """
-    
+
+    __slots__ = ('rect', 'color')
+
     def __init__(self, x: int, y: int, width: int, height: int) -> None:
         """
         Create obstacle with position and dimensions.
@@ -263,9 +554,12 @@ class Enemy:
         color: RGB tuple for enemy color
         speed: Movement speed
         direction: Current facing/movement direction in degrees
-        move_timer: Frames until next direction change
+        change_at: Absolute frame number of the next direction change
     """
-    
+
+    __slots__ = ('x', 'y', 'size', 'color', 'speed', 'direction',
+                 'change_at')
+
     def __init__(self, x: int, y: int) -> None:
         """
         Create enemy at the specified position.
@@ -274,69 +568,137 @@ class Enemy:
             x: Starting x position
             y: Starting y position
         """
-        self.x: float = x
-        self.y: float = y
+        # Positions are kept as plain ints (see CARDINAL_STEP)
+        self.x: int = int(x)
+        self.y: int = int(y)
         self.size: int = 18
         self.color: Tuple[int, int, int] = RED
         self.speed: int = ENEMY_SPEED
         
         # AI behavior: start facing a random cardinal direction
-        # random.choice picks one item from a list
-        self.direction: int = random.choice([0, 90, 180, 270])
-        
-        # Timer counts frames until we pick a new direction
-        self.move_timer: int = 0
-    
-    def update(self) -> None:
+        # random.choice picks one item from a sequence
+        self.direction: int = random.choice(CARDINAL_DIRECTIONS)
+
+        # The next direction change is scheduled as an ABSOLUTE frame
+        # number (the round's frame counter starts at 0), rolled once
+        # here and once per change - no per-frame timer to maintain
+        self.change_at: int = fast_randint()
+
+    def update(self, frame: int) -> None:
         """
         Move enemy with simple patrol AI.
-        
+
         Behavior:
         - Move in current direction
         - Periodically change to a new random direction
         - Bounce off walls
+
+        Args:
+            frame: The round's current frame number, used to check the
+                scheduled direction change.
         """
-        # Increment timer and maybe change direction
-        self.move_timer += 1
-        if self.move_timer > random.randint(60, 120):  # Every 1-2 seconds
-            self.direction = random.choice([0, 90, 180, 270])
-            self.move_timer = 0
+        # Change direction when the scheduled frame arrives (every 1-2
+        # seconds) - a single comparison per frame instead of a counter
+        # increment plus a comparison
+        if frame >= self.change_at:
+            self.direction = random.choice(CARDINAL_DIRECTIONS)
+            self.change_at = frame + fast_randint()
         
-        # Move in current direction
-        self.x += math.cos(math.radians(self.direction)) * self.speed
-        self.y += math.sin(math.radians(self.direction)) * self.speed
+        # Move in current direction - integer unit step times integer
+        # speed, so x/y never leave the integers
+        dx, dy = CARDINAL_STEP[self.direction]
+        self.x += dx * self.speed
+        self.y += dy * self.speed
         
         # Bounce off walls (simple reflection)
-        if self.x < self.size or self.x > WINDOW_WIDTH - self.size:
-            self.direction = 180 - self.direction  # Reverse horizontal
-            self.x = max(self.size, min(WINDOW_WIDTH - self.size, self.x))
-        
-        if self.y < self.size or self.y > WINDOW_HEIGHT - self.size:
-            self.direction = -self.direction  # Reverse vertical
-            self.y = max(self.size, min(WINDOW_HEIGHT - self.size, self.y))
+        # Bind attributes/globals to locals once - this method runs for
+        # every enemy every frame.
+        size = self.size
+        ww, wh = WINDOW_WIDTH, WINDOW_HEIGHT
+        if self.x < size or self.x > ww - size:
+            self.direction = H_REFLECT[self.direction]  # Reverse horizontal
+            self.x = max(size, min(ww - size, self.x))
+
+        if self.y < size or self.y > wh - size:
+            self.direction = V_REFLECT[self.direction]  # Reverse vertical
+            self.y = max(size, min(wh - size, self.y))
     
-    def draw(self, surface: pygame.Surface) -> None:
-        """Draw enemy tank with direction indicator."""
-        # Body
-        pygame.draw.circle(
-            surface,
-            self.color,
-            (int(self.x), int(self.y)),
-            self.size
-        )
-        
-        # Direction indicator (smaller cannon than player)
-        end_x: float = self.x + math.cos(math.radians(self.direction)) * (self.size + 8)
-        end_y: float = self.y + math.sin(math.radians(self.direction)) * (self.size + 8)
-        pygame.draw.line(
-            surface,
-            WHITE,
-            (int(self.x), int(self.y)),
-            (int(end_x), int(end_y)),
-            3
+    # Shared sprite cache - enemies only ever face the four cardinal
+    # directions, so this holds at most four rotated surfaces.
+    _sprites: dict = {}
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        """Draw enemy tank (a cached pre-rendered sprite, one blit)."""
+        angle = int(self.direction) % 360
+        sprite = Enemy._sprites.get(angle)
+        if sprite is None:
+            base = Enemy._sprites.get("base")
+            if base is None:
+                base = _render_body_sprite(self.color, self.size, self.size + 8, 3)
+                Enemy._sprites["base"] = base
+            sprite = pygame.transform.rotate(base, -angle)
+            Enemy._sprites[angle] = sprite
+        return surface.blit(
+            sprite, sprite.get_rect(center=(self.x, self.y))
         )
 # Functions that perform specific tasks.
 # These keep our main game loop clean and make code reusable.
+if numba is not None and np is not None:
+
+    @numba.njit(cache=True, fastmath=True)
+    def _collide_bullets_enemies(bx, by, nb, ex, ey, ne, radius_sum_sq):
+        """
+        JIT-compiled bullet-vs-enemy collision kernel.
+
+        Explicit loops over the pool arrays - Numba compiles these to
+        tight machine code, which beats both the Python loop and the
+        equivalent multi-pass NumPy expression.
+
+        Returns:
+            (bullet_hit, enemy_hit, hits) - boolean masks over the
+            first nb bullets / ne enemies, plus the number of kills.
+        """
+        bullet_hit = np.zeros(nb, dtype=np.bool_)
+        enemy_hit = np.zeros(ne, dtype=np.bool_)
+        hits = 0
+        for i in range(nb):
+            for j in range(ne):
+                if enemy_hit[j]:
+                    continue
+                dx = bx[i] - ex[j]
+                dy = by[i] - ey[j]
+                if dx * dx + dy * dy < radius_sum_sq:
+                    bullet_hit[i] = True
+                    enemy_hit[j] = True
+                    hits += 1
+                    break
+        return bullet_hit, enemy_hit, hits
+
+else:
+    _collide_bullets_enemies = None
+
+
+def build_enemy_grid(enemies: List[Enemy]) -> dict:
+    """
+    Bucket enemies into a coarse spatial grid for fast collision lookup.
+
+    Checking every bullet against every enemy is O(bullets x enemies) -
+    fine with 3 enemies, but it grows quadratically as endless mode
+    spawns more. Instead we drop each enemy into a 64-pixel grid cell;
+    a bullet then only needs to check the few enemies in its own cell
+    and the 8 neighboring cells.
+
+    Returns:
+        Dict mapping (cell_x, cell_y) to the list of enemies in that cell.
+    """
+    grid: dict = {}
+    for enemy in enemies:
+        cell = (int(enemy.x) >> 6, int(enemy.y) >> 6)  # >> 6 == // 64
+        grid.setdefault(cell, []).append(enemy)
+    return grid
+
+
+
 def check_circle_collision(x1: float, y1: float, r1: int,
                            x2: float, y2: float, r2: int) -> bool:
     """
@@ -345,16 +707,32 @@ def check_circle_collision(x1: float, y1: float, r1: int,
     This is the Pythagorean theorem in action!
     Distance between centers = sqrt((x2-x1)² + (y2-y1)²)
     If distance < sum of radii, circles overlap.
-    
+
+    Performance note: we never need the actual distance, only the
+    comparison - so we compare SQUARED distance against the SQUARED
+    radius sum. Skipping math.sqrt gives the same answer (both sides
+    are non-negative) without a square-root call per check.
+
     Args:
         x1, y1, r1: First circle's center position and radius
         x2, y2, r2: Second circle's center position and radius
-    
+
     Returns:
         True if circles overlap, False otherwise.
     """
-    distance: float = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
-    return distance < (r1 + r2)
+    dx = x2 - x1
+    dy = y2 - y1
+    radius_sum = r1 + r2
+    return dx * dx + dy * dy < radius_sum * radius_sum
+
+
+# Optional native acceleration: if the Cython extension next to this
+# file has been built (cythonize -3 -i lesson/_geom.pyx), its typed
+# version replaces the pure-Python check_circle_collision above.
+try:
+    from _geom import check_circle_collision  # type: ignore[no-redef]  # noqa: F811
+except ImportError:
+    pass
 
 
 def check_circle_rect_collision(cx: float, cy: float, radius: int,
@@ -378,222 +756,327 @@ def check_circle_rect_collision(cx: float, cy: float, radius: int,
     # max/min clamps the point to rectangle bounds
     closest_x: float = max(rect.left, min(cx, rect.right))
     closest_y: float = max(rect.top, min(cy, rect.bottom))
-    
+
     # Check if closest point is within circle
-    distance: float = math.sqrt((cx - closest_x) ** 2 + (cy - closest_y) ** 2)
-    return distance < radius
+    # (squared-distance comparison - see check_circle_collision)
+    dx = cx - closest_x
+    dy = cy - closest_y
+    return dx * dx + dy * dy < radius * radius
+
+
+# Caches for draw_text: constructing a Font parses the TTF file, and
+# rendering a string rasterizes every glyph - both far too heavy to redo
+# 60 times a second for text that rarely changes (the controls hint is
+# literally constant; the score changes a few times a minute).
+_FONT_CACHE: dict = {}
+_TEXT_CACHE: dict = {}
+_TEXT_CACHE_MAX = 64  # Bound memory; cleared wholesale when exceeded
 
 
 def draw_text(surface: pygame.Surface, text: str, x: int, y: int,
-              color: Tuple[int, int, int] = WHITE, size: int = 24) -> None:
+              color: Tuple[int, int, int] = WHITE, size: int = 24) -> pygame.Rect:
     """
     Draw text on the screen.
-    
+
+    Fonts are created once per size and rendered text surfaces are
+    cached by (text, color, size), so repeated frames just blit.
+
     Args:
         surface: Where to draw (usually screen)
         text: The string to display
         x, y: Position for top-left of text
         color: Text color (default white)
         size: Font size in points (default 24)
+
+    Returns:
+        The screen rect the text occupies (for dirty-rect updates).
+    """
+    key = (text, color, size)
+    text_surface = _TEXT_CACHE.get(key)
+    if text_surface is None:
+        font = _FONT_CACHE.get(size)
+        if font is None:
+            font = _FONT_CACHE[size] = pygame.font.Font(None, size)
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_MAX:
+            _TEXT_CACHE.clear()
+        text_surface = _TEXT_CACHE[key] = font.render(text, True, color)
+    return surface.blit(text_surface, (x, y))
+
+def new_round() -> Tuple[Tank, BulletPool, List[Enemy], List[Obstacle]]:
     """
-    font = pygame.font.Font(None, size)  # None = pygame default font
-    text_surface = font.render(text, True, color)  # True = anti-aliasing
-    surface.blit(text_surface, (x, y))
+    Create the starting objects for a fresh round.
+
+    Restarting used to recurse into main(), which grew the Python call
+    stack a little with every restart. Instead the outer loop in main()
+    calls this to get a clean set of game objects and carries on.
+
+    Returns:
+        (player, bullets, enemies, obstacles) ready for a new round.
+    """
+    # Player tank - centered on screen
+    player = Tank(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2, GREEN)
+
+    # Bullets live in a pre-allocated pool of parallel arrays (see
+    # BulletPool); enemies and obstacles stay in ordinary lists.
+    bullets = BulletPool()
+
+    # Spawn initial enemies in the top portion of the screen
+    enemies: List[Enemy] = [
+        Enemy(random.randint(50, WINDOW_WIDTH - 50), random.randint(50, 150))
+        for _ in range(3)
+    ]
+
+    # Create obstacle layout
+    # These provide cover and make gameplay more interesting
+    obstacles: List[Obstacle] = [
+        Obstacle(150, 200, 100, 20),   # Top left horizontal
+        Obstacle(550, 200, 100, 20),   # Top right horizontal
+        Obstacle(300, 350, 20, 150),   # Left vertical
+        Obstacle(480, 350, 20, 150),   # Right vertical
+    ]
+
+    return player, bullets, enemies, obstacles
+
 
 def main() -> None:
     """
     Main game function - contains the game loop.
-    
+
     The game loop is the heartbeat of every game. It runs continuously
     (60 times per second in our case) and does three things:
-    
+
     1. PROCESS INPUT - What did the player do?
     2. UPDATE STATE - Move things, check collisions, update game logic
     3. RENDER - Draw everything to the screen
-    
+
     This pattern is sometimes called the "game loop" or "main loop"
     and is used in virtually every video game ever made.
+
+    An outer loop wraps the game loop so pressing R after a game over
+    simply starts a new round - no recursion, no stack growth.
     """
-    # ---- GAME STATE VARIABLES ----
-    # These track the overall state of the game
     running: bool = True          # False = exit game
-    game_over: bool = False       # True = player lost
-    score: int = 0                # Points earned
-    
-    # ---- CREATE GAME OBJECTS ----
-    
-    # Player tank - centered on screen
-    player = Tank(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2, GREEN)
-    
-    # Lists to hold multiple objects
-    # Lists are perfect for this - we can add/remove items dynamically!
-    bullets: List[Bullet] = []
-    enemies: List[Enemy] = []
-    obstacles: List[Obstacle] = []
-    
-    # Spawn initial enemies in the top portion of the screen
-    for _ in range(3):  # underscore = we don't need the loop variable
-        enemies.append(Enemy(
-            random.randint(50, WINDOW_WIDTH - 50),
-            random.randint(50, 150)
-        ))
-    
-    # Create obstacle layout
-    # These provide cover and make gameplay more interesting
-    obstacles.append(Obstacle(150, 200, 100, 20))   # Top left horizontal
-    obstacles.append(Obstacle(550, 200, 100, 20))   # Top right horizontal
-    obstacles.append(Obstacle(300, 350, 20, 150))   # Left vertical
-    obstacles.append(Obstacle(480, 350, 20, 150))   # Right vertical
-    
+
+    # Hoist frequently-read globals into locals once. Inside the loop
+    # each of these becomes a LOAD_FAST instead of a LOAD_GLOBAL plus
+    # attribute chain - a small win paid back sixty times a second.
+    get_events = pygame.event.get
+    get_pressed = pygame.key.get_pressed
+    update_display = pygame.display.update
+    tick = clock.tick
+    randint = random.randint
+    ev_quit, ev_keydown = pygame.QUIT, pygame.KEYDOWN
+    k_w, k_up = pygame.K_w, pygame.K_UP
+    k_s, k_down = pygame.K_s, pygame.K_DOWN
+    k_a, k_left = pygame.K_a, pygame.K_LEFT
+    k_d, k_right = pygame.K_d, pygame.K_RIGHT
+    k_space, k_r = pygame.K_SPACE, pygame.K_r
+
     # ========================================
-    # THE GAME LOOP - Runs ~60 times per second
+    # OUTER LOOP - one iteration per round
     # ========================================
     while running:
+        # ---- GAME STATE VARIABLES ----
+        game_over: bool = False       # True = player lost
+        restart: bool = False         # True = R pressed, start new round
+        score: int = 0                # Points earned
+
+        # ---- CREATE GAME OBJECTS ----
+        player, bullets, enemies, obstacles = new_round()
+
+        # Static background, rendered once: clearing and re-flipping the
+        # whole screen every frame wastes fill-rate when obstacles and
+        # the controls hint never move. Each frame we restore only the
+        # small rects that dynamic objects touched last frame ("dirty
+        # rects") and tell pygame to update just those areas.
+        background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        background.fill(BLACK)
+        for obstacle in obstacles:
+            obstacle.draw(background)
+        draw_text(background, "WASD/Arrows: Move | SPACE: Shoot", 10, WINDOW_HEIGHT - 30)
+
+        # First frame: everything is dirty, so the whole screen gets drawn
+        screen.blit(background, (0, 0))
+        dirty: List[pygame.Rect] = [screen.get_rect()]
+
+        # Frame counter for this round - drives enemy AI scheduling
+        frame = 0
+
+        # ========================================
+        # THE GAME LOOP - Runs ~60 times per second
+        # ========================================
+        while running and not restart:
+            frame += 1
+
+            # ---- STEP 1: PROCESS INPUT ----
+            # pygame.event.get() returns all events since last check
+            # Events are things like key presses, mouse clicks, window close
+
+            for event in get_events((ev_quit, ev_keydown)):
+                # Window close button
+                if event.type == ev_quit:
+                    running = False
+
+                # KEYDOWN fires once when a key is pressed (not held)
+                # This is perfect for actions that should happen once,
+                # like shooting or restarting
+                if event.type == ev_keydown:
+                    if event.key == k_space and not game_over:
+                        player.shoot_into(bullets)
+                    if event.key == k_r and game_over:
+                        # Flag a restart; the outer loop builds the next round
+                        restart = True
         
-        # ---- STEP 1: PROCESS INPUT ----
-        # pygame.event.get() returns all events since last check
-        # Events are things like key presses, mouse clicks, window close
-        
-        for event in pygame.event.get():
-            # Window close button
-            if event.type == pygame.QUIT:
-                running = False
-            
-            # KEYDOWN fires once when a key is pressed (not held)
-            # This is perfect for actions that should happen once,
-            # like shooting or restarting
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE and not game_over:
-                    bullets.append(player.shoot())
-                if event.key == pygame.K_r and game_over:
-                    # Restart by calling main() again
-                    # This is a simple approach - resets everything
-                    return main()
-        
-        # Only process gameplay if not game over
-        if not game_over:
-            # Check for HELD keys (continuous input)
-            # get_pressed() returns current state of ALL keys
-            keys = pygame.key.get_pressed()
+            # Only process gameplay if not game over
+            if not game_over:
+                # Check for HELD keys (continuous input)
+                # get_pressed() returns current state of ALL keys
+                keys = get_pressed()
             
-            if keys[pygame.K_w] or keys[pygame.K_UP]:
-                player.move_forward()
-            if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-                player.move_backward()
-            if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-                player.rotate_left()
-            if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-                player.rotate_right()
+                if keys[k_w] or keys[k_up]:
+                    player.move_forward()
+                if keys[k_s] or keys[k_down]:
+                    player.move_backward()
+                if keys[k_a] or keys[k_left]:
+                    player.rotate_left()
+                if keys[k_d] or keys[k_right]:
+                    player.rotate_right()
             
-            # ---- STEP 2: UPDATE GAME STATE ----
-            
-            # Update all bullets (move them forward)
-            for bullet in bullets:
-                bullet.update()
-            
-            # Update all enemies (AI movement)
-            for enemy in enemies:
-                enemy.update()
-            
-            # ---- COLLISION DETECTION ----
+                # ---- STEP 2: UPDATE GAME STATE ----
+
+                # Move every bullet and cull off-screen/obstacle hits in one
+                # call - vectorized over the pool's arrays when NumPy is
+                # available, a single fused scalar pass otherwise.
+                bullets.update_and_cull(obstacles)
+
+                # Update all enemies (AI movement)
+                for enemy in enemies:
+                    enemy.update(frame)
             
-            # Track what needs to be removed
-            # We can't remove items while iterating, so we collect them first
-            bullets_to_remove: List[Bullet] = []
-            enemies_to_remove: List[Enemy] = []
+                # ---- COLLISION DETECTION ----
+
+                # Track what needs to be removed
+                # We can't remove items while iterating, so we collect them first
+                dead_bullets: set = set()          # Pool indices of spent bullets
+                enemies_to_remove: List[Enemy] = []
+
+                # Check bullet-enemy collisions
+                if _collide_bullets_enemies is not None and bullets.count and enemies:
+                    # JIT path: hand the pool arrays plus enemy positions to
+                    # the compiled kernel and read back the hit masks.
+                    ex = np.array([e.x for e in enemies], dtype=np.float32)
+                    ey = np.array([e.y for e in enemies], dtype=np.float32)
+                    radius_sum = BULLET_SIZE + enemies[0].size
+                    bullet_hit, enemy_hit, hits = _collide_bullets_enemies(
+                        bullets.x, bullets.y, bullets.count,
+                        ex, ey, len(enemies),
+                        float(radius_sum * radius_sum),
+                    )
+                    dead_bullets = {i for i in range(bullets.count) if bullet_hit[i]}
+                    enemies_to_remove = [e for j, e in enumerate(enemies) if enemy_hit[j]]
+                    score += 100 * hits  # Award points!
+                else:
+                    # Python path: build the spatial grid once, then each
+                    # bullet only tests enemies in its 3x3 cell neighborhood
+                    # instead of ALL enemies.
+                    enemy_grid = build_enemy_grid(enemies)
+                    bullet_x, bullet_y = bullets.x, bullets.y
+                    for i in range(bullets.count):
+                        bx = bullet_x[i]
+                        by = bullet_y[i]
+                        cell_x = int(bx) >> 6
+                        cell_y = int(by) >> 6
+                        hit = False
+                        for dx in (-1, 0, 1):
+                            if hit:
+                                break
+                            for dy in (-1, 0, 1):
+                                for enemy in enemy_grid.get((cell_x + dx, cell_y + dy), ()):
+                                    if check_circle_collision(
+                                        bx, by, BULLET_SIZE,
+                                        enemy.x, enemy.y, enemy.size
+                                    ):
+                                        dead_bullets.add(i)
+                                        enemies_to_remove.append(enemy)
+                                        score += 100  # Award points!
+                                        hit = True  # One hit per bullet
+                                        break
+                                if hit:
+                                    break
+
+                # Remove destroyed objects
+                # Spent bullets are compacted out of the pool; enemies are
+                # rebuilt in one pass using a set of ids (O(1) membership
+                # test instead of list.remove's O(n) scan per removal).
+                bullets.kill(dead_bullets)
+                rm_e = {id(e) for e in enemies_to_remove}
+                enemies = [e for e in enemies if id(e) not in rm_e]
             
-            # Check bullet-enemy collisions
-            for bullet in bullets:
+                # Check player-enemy collision (game over!)
                 for enemy in enemies:
                     if check_circle_collision(
-                        bullet.x, bullet.y, bullet.radius,
+                        player.x, player.y, player.size,
                         enemy.x, enemy.y, enemy.size
                     ):
-                        bullets_to_remove.append(bullet)
-                        enemies_to_remove.append(enemy)
-                        score += 100  # Award points!
+                        game_over = True
             
-            # Remove destroyed objects
-            for bullet in bullets_to_remove:
-                if bullet in bullets:  # Safety check
-                    bullets.remove(bullet)
-            for enemy in enemies_to_remove:
-                if enemy in enemies:
-                    enemies.remove(enemy)
-            
-            # Remove bullets that hit obstacles or left screen
-            # This is a LIST COMPREHENSION - a Pythonic way to filter lists
-            # It reads: "keep bullets that haven't hit obstacles and aren't off screen"
-            bullets = [b for b in bullets if not any(
-                check_circle_rect_collision(b.x, b.y, b.radius, obs.rect)
-                for obs in obstacles
-            ) and not b.is_off_screen()]
-            
-            # Check player-enemy collision (game over!)
-            for enemy in enemies:
-                if check_circle_collision(
-                    player.x, player.y, player.size,
-                    enemy.x, enemy.y, enemy.size
-                ):
-                    game_over = True
-            
-            # Spawn new enemies when all are destroyed (endless mode)
-            if len(enemies) == 0:
-                for _ in range(3):
-                    enemies.append(Enemy(
-                        random.randint(50, WINDOW_WIDTH - 50),
-                        random.randint(50, 150)
-                    ))
-        
-        # ---- STEP 3: RENDER (DRAW) ----
-        # We draw in layers: background first, then objects, then UI
-        
-        # Clear screen with black
-        screen.fill(BLACK)
-        
-        # Draw obstacles (background layer)
-        for obstacle in obstacles:
-            obstacle.draw(screen)
-        
-        # Draw bullets
-        for bullet in bullets:
-            bullet.draw(screen)
+                # Spawn new enemies when all are destroyed (endless mode)
+                if len(enemies) == 0:
+                    for _ in range(3):
+                        enemies.append(Enemy(
+                            randint(50, WINDOW_WIDTH - 50),
+                            randint(50, 150)
+                        ))
         
-        # Draw enemies
-        for enemy in enemies:
-            enemy.draw(screen)
-        
-        # Draw player (on top so they're always visible)
-        player.draw(screen)
-        
-        # Draw UI (score and controls)
-        draw_text(screen, f"Score: {score}", 10, 10)
-        draw_text(screen, "WASD/Arrows: Move | SPACE: Shoot", 10, WINDOW_HEIGHT - 30)
-        
-        # Game over overlay
-        if game_over:
-            draw_text(
-                screen, "GAME OVER",
-                WINDOW_WIDTH // 2 - 80, WINDOW_HEIGHT // 2 - 20,
-                RED, 48
-            )
-            draw_text(
-                screen, f"Final Score: {score}",
-                WINDOW_WIDTH // 2 - 70, WINDOW_HEIGHT // 2 + 30
-            )
-            draw_text(
-                screen, "Press R to Restart",
-                WINDOW_WIDTH // 2 - 80, WINDOW_HEIGHT // 2 + 60
-            )
-        
-        # Flip the display buffer
-        # This shows everything we just drew
-        # (Double buffering prevents screen flicker)
-        pygame.display.flip()
+            # ---- STEP 3: RENDER (DRAW) ----
+            # Dirty-rect rendering: restore the background under last
+            # frame's dynamic objects, redraw this frame's objects while
+            # collecting the rects they touch, then update ONLY those areas.
+            # Obstacles and the controls hint live on the background surface.
+
+            # Erase last frame's dynamic rects
+            for rect in dirty:
+                screen.blit(background, rect, rect)
+
+            new_dirty: List[pygame.Rect] = []
+
+            # Draw bullets
+            new_dirty.extend(bullets.draw(screen))
+
+            # Draw enemies
+            for enemy in enemies:
+                new_dirty.append(enemy.draw(screen))
+
+            # Draw player (on top so they're always visible)
+            new_dirty.append(player.draw(screen))
+
+            # Draw UI (score; controls hint is baked into the background)
+            new_dirty.append(draw_text(screen, f"Score: {score}", 10, 10))
+
+            # Game over overlay
+            if game_over:
+                new_dirty.append(draw_text(
+                    screen, "GAME OVER",
+                    WINDOW_WIDTH // 2 - 80, WINDOW_HEIGHT // 2 - 20,
+                    RED, 48
+                ))
+                new_dirty.append(draw_text(
+                    screen, f"Final Score: {score}",
+                    WINDOW_WIDTH // 2 - 70, WINDOW_HEIGHT // 2 + 30
+                ))
+                new_dirty.append(draw_text(
+                    screen, "Press R to Restart",
+                    WINDOW_WIDTH // 2 - 80, WINDOW_HEIGHT // 2 + 60
+                ))
+
+            # Push just the changed regions to the display - both the areas
+            # we erased and the areas we drew this frame
+            update_display(dirty + new_dirty)
+            dirty = new_dirty
         
-        # Control game speed
-        # tick(60) means "wait enough time to achieve 60 FPS"
-        clock.tick(FPS)
+            # Control game speed
+            # tick(60) means "wait enough time to achieve 60 FPS"
+            tick(FPS)
     
     # Clean shutdown
     pygame.quit()
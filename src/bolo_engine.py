@@ -19,14 +19,31 @@ License: MIT
 
 from __future__ import annotations
 
+import itertools
 import math
 import random
-from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import IntEnum, auto
 from typing import Dict, List, Optional, Tuple, Protocol, Set
+import numpy as np
 import pygame
 
+# Numba is optional: when installed, the shell integration/collision
+# step below runs as a JIT-compiled kernel (compiled on first use,
+# once per process). Without it the NumPy multi-pass path is used.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# JIT broad-phase kernel for shell collisions (None without numba).
+# The relative import covers package use (src.bolo_engine); the
+# absolute one covers running this module standalone.
+try:
+    from .collision_kernels import first_hit_per_shell
+except ImportError:
+    from collision_kernels import first_hit_per_shell
+
 # Type aliases for clarity
 Position = Tuple[float, float]
 TileCoord = Tuple[int, int]
@@ -74,7 +91,7 @@ class Config:
     TANK_MAX_MINES: int = 40
     TANK_MAX_WOOD: int = 40
     TANK_BASE_SPEED: float = 2.0
-    TANK_ROTATION_SPEED: float = 4.0  # Degrees per frame
+    TANK_ROTATION_SPEED: int = 4  # Whole degrees per frame
     TANK_SIZE: int = 12  # Radius in pixels
     
     # Combat
@@ -99,6 +116,14 @@ class Config:
     BOAT_COST: int = 5
 
 
+# Precomputed whole-degree trig tables. Tank headings only change in
+# TANK_ROTATION_SPEED (integer-degree) steps, so indexing by
+# int(angle) % 360 is exact on the movement and draw hot paths - two
+# tuple loads replace two libm calls plus a radians conversion.
+COS_DEG: Tuple[float, ...] = tuple(math.cos(math.radians(a)) for a in range(360))
+SIN_DEG: Tuple[float, ...] = tuple(math.sin(math.radians(a)) for a in range(360))
+
+
 class TileType(IntEnum):
     """Terrain tile types matching original BOLO."""
     DEEP_WATER = 0    # Drowns tanks, needs boat
@@ -141,6 +166,36 @@ TERRAIN_DATA: Dict[TileType, TerrainInfo] = {
 }
 
 
+# Per-tile-type color tables, indexed by integer tile id. These let the
+# terrain surface rebuild run as a few whole-array NumPy operations
+# (index the LUT by the tile array) instead of per-tile draw calls.
+TERRAIN_COLOR_LUT: np.ndarray = np.array(
+    [TERRAIN_DATA[t].color for t in TileType], dtype=np.uint8
+)
+# Grid-line shade: each base color darkened by 10, as draw.rect used to
+TERRAIN_GRID_LUT: np.ndarray = np.clip(
+    TERRAIN_COLOR_LUT.astype(np.int16) - 10, 0, 255
+).astype(np.uint8)
+
+# Flat terrain property tables, also indexed by integer tile id. The
+# movement and shell hot paths query terrain every frame for every
+# entity; a single array load here replaces a TERRAIN_DATA dict lookup
+# plus a dataclass attribute access. TERRAIN_DATA remains the source
+# of truth - these are derived views of it.
+SPEED_MULT: np.ndarray = np.array(
+    [TERRAIN_DATA[t].speed_multiplier for t in TileType], dtype=np.float32
+)
+PASSABLE: np.ndarray = np.array(
+    [TERRAIN_DATA[t].passable for t in TileType], dtype=np.bool_
+)
+BLOCKS_SHOTS: np.ndarray = np.array(
+    [TERRAIN_DATA[t].blocks_shots for t in TileType], dtype=np.bool_
+)
+DESTRUCTIBLE: np.ndarray = np.array(
+    [TERRAIN_DATA[t].destructible for t in TileType], dtype=np.bool_
+)
+
+
 class Team(IntEnum):
     """Player/structure team affiliations."""
     NEUTRAL = 0
@@ -159,25 +214,44 @@ TEAM_COLORS: Dict[Team, Color] = {
     Team.TEAM_4: (218, 165, 32),  # Goldenrod
 }
 
+# Dense tuple view of TEAM_COLORS: team ids are small contiguous ints,
+# so the per-frame draw paths index this instead of hashing into the
+# dict (which also needed a .get default that can never trigger).
+TEAM_COLOR_TABLE: Tuple[Color, ...] = tuple(TEAM_COLORS[t] for t in Team)
+
 
 # =============================================================================
 # SECTION 2: ENTITY SYSTEM
 # =============================================================================
 
-class Entity(ABC):
+class Entity:
     """
     Base class for all game entities.
-    
+
     Entities are objects in the game world with position, lifecycle,
-    and optional rendering. This provides a common interface for
-    the game loop to process all objects uniformly.
+    and optional rendering. A plain base class rather than an ABC:
+    the frame loop iterates homogeneous typed lists, so nothing needs
+    abstract-method enforcement, and dropping ABCMeta keeps entity
+    classes on the default (cheaper) metaclass. Subclasses override
+    update/draw; the defaults are no-ops.
     """
     
-    _next_id: int = 0
-    
+    # Monotonic id stream; next() is a single C-level call, cheaper
+    # than the read-increment-write on a class attribute it replaces
+    _next_id = itertools.count()
+
+    # Draw order: lower layers render first (under higher ones).
+    # Subclasses override; the render pass sorts buckets by this once,
+    # not entities per frame.
+    RENDER_LAYER: int = 0
+
+    # Fixed attribute layout: skips the per-instance __dict__, which
+    # shrinks entities and speeds up the attribute reads that dominate
+    # the frame loop. Every subclass extends this with its own slots.
+    __slots__ = ('id', 'x', 'y', 'alive')
+
     def __init__(self, x: float, y: float) -> None:
-        self.id: int = Entity._next_id
-        Entity._next_id += 1
+        self.id: int = next(Entity._next_id)
         self.x: float = x
         self.y: float = y
         self.alive: bool = True
@@ -191,12 +265,10 @@ class Entity(ABC):
         """Get the tile coordinates this entity occupies."""
         return (int(self.x // Config.TILE_SIZE), int(self.y // Config.TILE_SIZE))
     
-    @abstractmethod
     def update(self, game_state: "GameState") -> None:
         """Update entity state for this frame."""
         pass
-    
-    @abstractmethod
+
     def draw(self, surface: pygame.Surface, camera_offset: Position) -> None:
         """Render the entity to the given surface."""
         pass
@@ -206,13 +278,25 @@ class Entity(ABC):
         self.alive = False
 
 
-@dataclass
 class Resources:
-    """Container for tank resources."""
-    armor: int = Config.TANK_MAX_ARMOR
-    shells: int = Config.TANK_MAX_SHELLS
-    mines: int = Config.TANK_MAX_MINES
-    wood: int = 0
+    """
+    Container for tank resources.
+
+    A plain __slots__ class rather than a dataclass: resource fields
+    are read and written on the resupply/damage hot paths every frame,
+    and slotted attribute access skips the per-instance __dict__.
+    """
+
+    __slots__ = ('armor', 'shells', 'mines', 'wood')
+
+    def __init__(self, armor: int = Config.TANK_MAX_ARMOR,
+                 shells: int = Config.TANK_MAX_SHELLS,
+                 mines: int = Config.TANK_MAX_MINES,
+                 wood: int = 0) -> None:
+        self.armor = armor
+        self.shells = shells
+        self.mines = mines
+        self.wood = wood
 
 
 class Tank(Entity):
@@ -222,11 +306,21 @@ class Tank(Entity):
     The tank is the primary player unit with movement, combat,
     and resource management capabilities.
     """
-    
+
+    RENDER_LAYER = 3  # Above structures and mines
+
+    __slots__ = ('team', 'angle', 'resources', 'speed', 'size',
+                 'is_moving', 'has_boat', 'lgm_deployed', 'lgm_position',
+                 'lgm_respawn_timer', 'carried_pillboxes', 'fire_cooldown',
+                 'fire_rate', 'next_ai_fire_frame')
+
     def __init__(self, x: float, y: float, team: Team) -> None:
         super().__init__(x, y)
         self.team: Team = team
-        self.angle: float = 0.0  # Facing direction in degrees
+        # Facing direction in whole degrees, kept as an int 0..359 by
+        # the rotate methods: integer add + mod (cheaper than float
+        # modulo) and it indexes the trig tables without a cast
+        self.angle: int = 0
         self.resources: Resources = Resources()
         self.speed: float = Config.TANK_BASE_SPEED
         self.size: int = Config.TANK_SIZE
@@ -246,6 +340,10 @@ class Tank(Entity):
         # Firing cooldown
         self.fire_cooldown: int = 0
         self.fire_rate: int = 10  # Frames between shots
+
+        # AI fire schedule: absolute frame at which an AI-driven tank
+        # may next fire (unused for the player)
+        self.next_ai_fire_frame: int = 0
     
     def update(self, game_state: "GameState") -> None:
         """Process tank logic for this frame."""
@@ -263,8 +361,9 @@ class Tank(Entity):
         if terrain_speed <= 0:
             return
         
-        dx = math.cos(math.radians(self.angle)) * self.speed * terrain_speed
-        dy = math.sin(math.radians(self.angle)) * self.speed * terrain_speed
+        a = self.angle
+        dx = COS_DEG[a] * self.speed * terrain_speed
+        dy = SIN_DEG[a] * self.speed * terrain_speed
         
         new_x = self.x + dx
         new_y = self.y + dy
@@ -280,8 +379,9 @@ class Tank(Entity):
         if terrain_speed <= 0:
             return
         
-        dx = math.cos(math.radians(self.angle)) * self.speed * terrain_speed * 0.6
-        dy = math.sin(math.radians(self.angle)) * self.speed * terrain_speed * 0.6
+        a = self.angle
+        dx = COS_DEG[a] * self.speed * terrain_speed * 0.6
+        dy = SIN_DEG[a] * self.speed * terrain_speed * 0.6
         
         new_x = self.x - dx
         new_y = self.y - dy
@@ -308,9 +408,10 @@ class Tank(Entity):
         self.fire_cooldown = self.fire_rate
         
         # Spawn shell at cannon tip
+        a = self.angle
         cannon_length = self.size + 8
-        shell_x = self.x + math.cos(math.radians(self.angle)) * cannon_length
-        shell_y = self.y + math.sin(math.radians(self.angle)) * cannon_length
+        shell_x = self.x + COS_DEG[a] * cannon_length
+        shell_y = self.y + SIN_DEG[a] * cannon_length
         
         return Shell(shell_x, shell_y, self.angle, self.team, self.id)
     
@@ -337,14 +438,12 @@ class Tank(Entity):
     def _get_terrain_speed(self, game_state: "GameState") -> float:
         """Get movement speed multiplier for current terrain."""
         tile = game_state.game_map.get_tile(*self.tile_position)
-        terrain = TERRAIN_DATA.get(tile, TERRAIN_DATA[TileType.GRASS])
-        
+
         # Check for boat on water
-        if tile in (TileType.DEEP_WATER, TileType.RIVER) and not self.has_boat:
-            if tile == TileType.DEEP_WATER:
-                return 0.0  # Would drown
-        
-        return terrain.speed_multiplier
+        if tile == TileType.DEEP_WATER and not self.has_boat:
+            return 0.0  # Would drown
+
+        return float(SPEED_MULT[tile])
     
     def _can_move_to(self, x: float, y: float, game_state: "GameState") -> bool:
         """Check if tank can move to position."""
@@ -358,9 +457,8 @@ class Tank(Entity):
         tile_x = int(x // Config.TILE_SIZE)
         tile_y = int(y // Config.TILE_SIZE)
         tile = game_state.game_map.get_tile(tile_x, tile_y)
-        terrain = TERRAIN_DATA.get(tile, TERRAIN_DATA[TileType.GRASS])
-        
-        if not terrain.passable:
+
+        if not PASSABLE[tile]:
             # Special case: boat allows water passage
             if tile == TileType.DEEP_WATER and self.has_boat:
                 return True
@@ -368,27 +466,45 @@ class Tank(Entity):
         
         return True
     
+    # Class-level sprite caches shared by every tank: the base body is
+    # rendered once per team, rotated variants once per (team, degree).
+    # Rotations fill lazily - a tank only visits the angles its
+    # rotation step can reach, so the cache stays small.
+    _base_sprites: Dict[Team, pygame.Surface] = {}
+    _rotated_sprites: Dict[Tuple[Team, int], pygame.Surface] = {}
+
+    def _render_base_sprite(self) -> pygame.Surface:
+        """Render body, outline and cannon at angle 0 (once per team)."""
+        size = self.size
+        cannon_length = size + 10
+        half = cannon_length + 2
+        surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        center = (half, half)
+        color = TEAM_COLOR_TABLE[self.team]
+        pygame.draw.circle(surf, color, center, size)
+        pygame.draw.circle(surf, (40, 40, 40), center, size, 2)
+        pygame.draw.line(surf, (200, 200, 200), center,
+                        (half + cannon_length, half), 4)
+        pygame.draw.line(surf, (60, 60, 60), center,
+                        (half + cannon_length, half), 2)
+        return surf
+
     def draw(self, surface: pygame.Surface, camera_offset: Position) -> None:
-        """Render the tank."""
+        """Render the tank (one blit of a cached pre-rotated sprite)."""
+        angle = self.angle
+        key = (self.team, angle)
+        sprite = Tank._rotated_sprites.get(key)
+        if sprite is None:
+            base = Tank._base_sprites.get(self.team)
+            if base is None:
+                base = self._render_base_sprite()
+                Tank._base_sprites[self.team] = base
+            sprite = pygame.transform.rotate(base, -angle)
+            Tank._rotated_sprites[key] = sprite
+
         screen_x = int(self.x - camera_offset[0])
         screen_y = int(self.y - camera_offset[1])
-        
-        color = TEAM_COLORS.get(self.team, (100, 100, 100))
-        
-        # Tank body
-        pygame.draw.circle(surface, color, (screen_x, screen_y), self.size)
-        
-        # Tank outline
-        pygame.draw.circle(surface, (40, 40, 40), (screen_x, screen_y), self.size, 2)
-        
-        # Cannon
-        cannon_length = self.size + 10
-        end_x = screen_x + math.cos(math.radians(self.angle)) * cannon_length
-        end_y = screen_y + math.sin(math.radians(self.angle)) * cannon_length
-        pygame.draw.line(surface, (200, 200, 200), (screen_x, screen_y), 
-                        (int(end_x), int(end_y)), 4)
-        pygame.draw.line(surface, (60, 60, 60), (screen_x, screen_y), 
-                        (int(end_x), int(end_y)), 2)
+        surface.blit(sprite, sprite.get_rect(center=(screen_x, screen_y)))
 
 
 class Shell(Entity):
@@ -397,8 +513,13 @@ class Shell(Entity):
     
     Shells travel in a straight line and deal damage on impact.
     """
-    
-    def __init__(self, x: float, y: float, angle: float, 
+
+    RENDER_LAYER = 4  # Topmost
+
+    __slots__ = ('angle', 'team', 'owner_id', 'speed', 'damage',
+                 'lifetime', 'radius')
+
+    def __init__(self, x: float, y: float, angle: float,
                  team: Team, owner_id: int) -> None:
         super().__init__(x, y)
         self.angle: float = angle
@@ -423,10 +544,9 @@ class Shell(Entity):
         
         # Terrain collision
         tile = game_state.game_map.get_tile(*self.tile_position)
-        terrain = TERRAIN_DATA.get(tile, TERRAIN_DATA[TileType.GRASS])
-        if terrain.blocks_shots:
+        if BLOCKS_SHOTS[tile]:
             # Damage destructible terrain
-            if terrain.destructible:
+            if DESTRUCTIBLE[tile]:
                 game_state.game_map.damage_tile(*self.tile_position)
             self.destroy()
             return
@@ -446,13 +566,207 @@ class Shell(Entity):
                           self.radius - 1)
 
 
+if numba is not None:
+
+    # No cache=True: this module runs both as src.bolo_engine and as
+    # standalone bolo_engine, and the numba disk cache binds the
+    # compiled kernel to whichever module name wrote it - loading it
+    # under the other name raises ModuleNotFoundError mid-frame.
+    @numba.njit(fastmath=True)
+    def _step_shells_kernel(x, y, vx, vy, life, tiles, blocks, destruct,
+                            pw, ph, tile_size):
+        """
+        Fused shell step: move, age, and classify deaths in ONE pass.
+
+        The NumPy path below needs several full-array traversals for
+        the same logic; this single loop with predictable branches
+        compiles to tight machine code. Returns the death mask plus
+        the tile coordinates to damage (destructible impacts).
+        """
+        n = x.shape[0]
+        dead = np.zeros(n, dtype=np.bool_)
+        dmg_x = np.empty(n, dtype=np.int32)
+        dmg_y = np.empty(n, dtype=np.int32)
+        dmg_n = 0
+        for i in range(n):
+            xi = x[i] + vx[i]
+            yi = y[i] + vy[i]
+            x[i] = xi
+            y[i] = yi
+            life[i] -= 1
+            if xi < 0 or xi > pw or yi < 0 or yi > ph:
+                dead[i] = True
+                continue
+            tx = min(int(xi), pw - 1) // tile_size
+            ty = min(int(yi), ph - 1) // tile_size
+            t = tiles[ty, tx]
+            if blocks[t]:
+                if destruct[t]:
+                    dmg_x[dmg_n] = tx
+                    dmg_y[dmg_n] = ty
+                    dmg_n += 1
+                dead[i] = True
+            elif life[i] <= 0:
+                dead[i] = True
+        return dead, dmg_x, dmg_y, dmg_n
+
+else:
+    _step_shells_kernel = None
+
+
+class ShellPool:
+    """
+    Structure-of-arrays container for all live shells.
+
+    Shells are the most numerous moving entity, and advancing them one
+    Python method call at a time dominated the update loop. The pool
+    keeps their state in parallel NumPy arrays (indices [0:count) are
+    live) so each frame moves, ages and collides every shell with a
+    handful of whole-array operations instead of per-shell dispatch.
+
+    Shell objects are still used as the spawn interface - Tank.fire
+    and Pillbox._fire_at return them - but GameState.add_entity folds
+    them into this pool rather than the entity list.
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        self.capacity: int = capacity
+        self.count: int = 0
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.lifetime = np.zeros(capacity, dtype=np.int32)
+        self.team = np.zeros(capacity, dtype=np.int16)
+        self.owner_id = np.zeros(capacity, dtype=np.int64)
+
+        # Shared per-shell constants (identical for every shell)
+        self.radius: int = 3
+        self.damage: int = Config.SHELL_DAMAGE
+
+    def _grow(self) -> None:
+        """Double the capacity, preserving live shells."""
+        new_cap = self.capacity * 2
+        for name in ('x', 'y', 'vx', 'vy', 'lifetime', 'team', 'owner_id'):
+            old = getattr(self, name)
+            new = np.zeros(new_cap, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = new_cap
+
+    def spawn(self, x: float, y: float, angle: float,
+              team: Team, owner_id: int) -> None:
+        """Add a shell; velocity is computed once here, not per frame."""
+        if self.count >= self.capacity:
+            self._grow()
+        i = self.count
+        rad = math.radians(angle)
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = math.cos(rad) * Config.SHELL_SPEED
+        self.vy[i] = math.sin(rad) * Config.SHELL_SPEED
+        self.lifetime[i] = Config.SHELL_LIFETIME
+        self.team[i] = team
+        self.owner_id[i] = owner_id
+        self.count += 1
+
+    def update(self, game_map: "GameMap") -> None:
+        """
+        Advance every shell one frame and cull terrain/lifetime deaths.
+
+        Vectorized: two adds for movement, one fancy-indexed tile
+        lookup for terrain, boolean masks for the rest. Destructible
+        impacts (rare) fall back to per-tile damage_tile calls.
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        if _step_shells_kernel is not None:
+            # JIT path: one fused pass over the pool arrays
+            dead, dmg_x, dmg_y, dmg_n = _step_shells_kernel(
+                self.x[:n], self.y[:n], self.vx[:n], self.vy[:n],
+                self.lifetime[:n], game_map.tiles,
+                BLOCKS_SHOTS, DESTRUCTIBLE,
+                game_map.pixel_width, game_map.pixel_height,
+                Config.TILE_SIZE,
+            )
+            for i in range(dmg_n):
+                game_map.damage_tile(int(dmg_x[i]), int(dmg_y[i]))
+            if dead.any():
+                self._compact(~dead)
+            return
+
+        x = self.x[:n]
+        y = self.y[:n]
+        x += self.vx[:n]
+        y += self.vy[:n]
+        life = self.lifetime[:n]
+        life -= 1
+
+        out_of_bounds = (
+            (x < 0) | (x > game_map.pixel_width) |
+            (y < 0) | (y > game_map.pixel_height)
+        )
+
+        # Tile under each shell (clipped so OOB shells index safely -
+        # they are already marked dead above)
+        tx = np.clip(x, 0, game_map.pixel_width - 1).astype(np.int32)
+        tx //= Config.TILE_SIZE
+        ty = np.clip(y, 0, game_map.pixel_height - 1).astype(np.int32)
+        ty //= Config.TILE_SIZE
+        tiles = game_map.tiles[ty, tx]
+
+        blocked = BLOCKS_SHOTS[tiles] & ~out_of_bounds
+        dead = blocked | out_of_bounds | (life <= 0)
+
+        # Damage the (few) destructible tiles that were hit
+        if blocked.any():
+            for i in np.nonzero(blocked & DESTRUCTIBLE[tiles])[0]:
+                game_map.damage_tile(int(tx[i]), int(ty[i]))
+
+        if dead.any():
+            self._compact(~dead)
+
+    def kill(self, indices: Set[int]) -> None:
+        """Remove the shells at the given pool indices (after hits)."""
+        if not indices:
+            return
+        keep = np.ones(self.count, dtype=np.bool_)
+        keep[list(indices)] = False
+        self._compact(keep)
+
+    def _compact(self, keep: np.ndarray) -> None:
+        """Pack surviving shells to the front of the arrays."""
+        k = int(keep.sum())
+        n = self.count
+        for name in ('x', 'y', 'vx', 'vy', 'lifetime', 'team', 'owner_id'):
+            arr = getattr(self, name)
+            arr[:k] = arr[:n][keep]
+        self.count = k
+
+    def draw(self, surface: pygame.Surface, camera_offset: Position) -> None:
+        """Render all shells (same two-circle look as Shell.draw had)."""
+        cam_x, cam_y = camera_offset
+        draw_circle = pygame.draw.circle
+        radius = self.radius
+        for i in range(self.count):
+            pos = (int(self.x[i] - cam_x), int(self.y[i] - cam_y))
+            draw_circle(surface, (255, 200, 50), pos, radius)
+            draw_circle(surface, (255, 255, 200), pos, radius - 1)
+
+
 class Mine(Entity):
     """
     Explosive mine that detonates on contact.
     
     Mines can be visible (dropped) or hidden (drilled by LGM).
     """
-    
+
+    RENDER_LAYER = 2
+
+    __slots__ = ('team', 'hidden', 'damage', 'radius', 'detection_radius')
+
     def __init__(self, x: float, y: float, team: Team, hidden: bool = False) -> None:
         super().__init__(x, y)
         self.team: Team = team
@@ -471,17 +785,26 @@ class Mine(Entity):
         game_state.game_map.set_tile(*self.tile_position, TileType.CRATER)
         self.destroy()
     
+    # All visible mines look identical - one shared cached sprite
+    _sprite: Optional[pygame.Surface] = None
+
     def draw(self, surface: pygame.Surface, camera_offset: Position) -> None:
-        """Render the mine (if visible)."""
+        """Render the mine (if visible) as one cached-sprite blit."""
         if self.hidden:
             return  # Don't draw hidden mines (except to owner team)
-        
+
+        sprite = Mine._sprite
+        if sprite is None:
+            side = self.radius * 2
+            sprite = pygame.Surface((side, side), pygame.SRCALPHA)
+            center = (self.radius, self.radius)
+            pygame.draw.circle(sprite, (60, 60, 60), center, self.radius)
+            pygame.draw.circle(sprite, (40, 40, 40), center, self.radius - 2)
+            Mine._sprite = sprite
+
         screen_x = int(self.x - camera_offset[0])
         screen_y = int(self.y - camera_offset[1])
-        
-        pygame.draw.circle(surface, (60, 60, 60), (screen_x, screen_y), self.radius)
-        pygame.draw.circle(surface, (40, 40, 40), (screen_x, screen_y), 
-                          self.radius - 2)
+        surface.blit(sprite, (screen_x - self.radius, screen_y - self.radius))
 
 
 class Pillbox(Entity):
@@ -491,7 +814,13 @@ class Pillbox(Entity):
     Pillboxes auto-fire at enemies within range. They can be
     captured, picked up by an LGM, and repositioned.
     """
-    
+
+    RENDER_LAYER = 0  # Bottom of the entity stack
+
+    __slots__ = ('team', 'health', 'fire_cooldown', 'fire_rate', 'range',
+                 '_range_sq', 'size', 'active', 'aggression',
+                 '_last_aggr_decay_frame')
+
     def __init__(self, x: float, y: float, team: Team = Team.NEUTRAL) -> None:
         super().__init__(x, y)
         self.team: Team = team
@@ -499,11 +828,13 @@ class Pillbox(Entity):
         self.fire_rate: int = Config.PILLBOX_FIRE_RATE
         self.fire_cooldown: int = 0
         self.range: float = Config.PILLBOX_RANGE
+        self._range_sq: float = self.range * self.range
         self.size: int = 8
         self.active: bool = True  # False when picked up
         
         # Progressive fire rate (increases when attacked)
         self.aggression: int = 0
+        self._last_aggr_decay_frame: int = 0
     
     def update(self, game_state: "GameState") -> None:
         """Process pillbox AI."""
@@ -513,9 +844,13 @@ class Pillbox(Entity):
         if self.fire_cooldown > 0:
             self.fire_cooldown -= 1
         
-        # Decay aggression over time
-        if self.aggression > 0 and random.random() < 0.01:
-            self.aggression = max(0, self.aggression - 1)
+        # Decay aggression over time: one step every 100 frames, the
+        # same average rate as the old `random.random() < 0.01` roll
+        # but deterministic and without an RNG call per frame
+        if (self.aggression > 0 and
+                game_state.frame_index - self._last_aggr_decay_frame >= 100):
+            self.aggression -= 1
+            self._last_aggr_decay_frame = game_state.frame_index
         
         # Find and engage targets
         if self.fire_cooldown <= 0:
@@ -526,17 +861,33 @@ class Pillbox(Entity):
                     game_state.add_entity(shell)
     
     def _find_target(self, game_state: "GameState") -> Optional[Tank]:
-        """Find nearest enemy tank in range."""
+        """
+        Find nearest enemy tank in range.
+
+        Queries the per-frame tank grid (cell size = PILLBOX_RANGE)
+        instead of scanning every entity: any tank in range must sit in
+        this cell or one of the 8 neighbors. Distances are compared
+        squared, so no sqrt on this per-pillbox-per-frame path.
+        """
+        grid = game_state.tank_grid
+        cx = int(self.x) // TANK_GRID_CELL
+        cy = int(self.y) // TANK_GRID_CELL
+
         best_target: Optional[Tank] = None
-        best_distance: float = float('inf')
-        
-        for entity in game_state.entities:
-            if isinstance(entity, Tank) and entity.team != self.team:
-                dist = math.sqrt((entity.x - self.x)**2 + (entity.y - self.y)**2)
-                if dist < self.range and dist < best_distance:
-                    best_target = entity
-                    best_distance = dist
-        
+        best_d2: float = self._range_sq
+
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                for tank in grid.get((gx, gy), ()):
+                    if tank.team == self.team:
+                        continue
+                    dx = tank.x - self.x
+                    dy = tank.y - self.y
+                    d2 = dx * dx + dy * dy
+                    if d2 < best_d2:
+                        best_target = tank
+                        best_d2 = d2
+
         return best_target
     
     def _fire_at(self, target: Tank) -> Optional[Shell]:
@@ -566,29 +917,39 @@ class Pillbox(Entity):
         self.active = True
         self.aggression = 0
     
+    # Cached sprites keyed by (team, health indicator size) - at most
+    # a handful of variants per team ever get rendered
+    _sprites: Dict[Tuple[Team, int], pygame.Surface] = {}
+
     def draw(self, surface: pygame.Surface, camera_offset: Position) -> None:
-        """Render the pillbox."""
+        """Render the pillbox (one blit of a cached sprite)."""
         if not self.active:
             return
-        
-        screen_x = int(self.x - camera_offset[0])
-        screen_y = int(self.y - camera_offset[1])
-        
-        color = TEAM_COLORS.get(self.team, (100, 100, 100))
-        
-        # Square pillbox body
-        rect = pygame.Rect(screen_x - self.size, screen_y - self.size,
-                          self.size * 2, self.size * 2)
-        pygame.draw.rect(surface, color, rect)
-        pygame.draw.rect(surface, (40, 40, 40), rect, 2)
-        
-        # Health indicator (inner square)
+
+        # Health indicator size is part of the cache key, so a damaged
+        # pillbox gets a freshly rendered (then cached) variant
         health_ratio = self.health / Config.PILLBOX_MAX_HEALTH
         inner_size = int(self.size * health_ratio)
-        if inner_size > 0:
-            inner_rect = pygame.Rect(screen_x - inner_size, screen_y - inner_size,
-                                    inner_size * 2, inner_size * 2)
-            pygame.draw.rect(surface, (200, 200, 200), inner_rect)
+
+        key = (self.team, inner_size)
+        sprite = Pillbox._sprites.get(key)
+        if sprite is None:
+            side = self.size * 2
+            sprite = pygame.Surface((side, side), pygame.SRCALPHA)
+            color = TEAM_COLOR_TABLE[self.team]
+            rect = pygame.Rect(0, 0, side, side)
+            pygame.draw.rect(sprite, color, rect)
+            pygame.draw.rect(sprite, (40, 40, 40), rect, 2)
+            if inner_size > 0:
+                inner_rect = pygame.Rect(self.size - inner_size,
+                                        self.size - inner_size,
+                                        inner_size * 2, inner_size * 2)
+                pygame.draw.rect(sprite, (200, 200, 200), inner_rect)
+            Pillbox._sprites[key] = sprite
+
+        screen_x = int(self.x - camera_offset[0])
+        screen_y = int(self.y - camera_offset[1])
+        surface.blit(sprite, (screen_x - self.size, screen_y - self.size))
 
 
 class Base(Entity):
@@ -598,7 +959,12 @@ class Base(Entity):
     Bases provide shells, mines, and armor repair. They slowly
     regenerate supplies and can be captured by enemy tanks.
     """
-    
+
+    RENDER_LAYER = 1
+
+    __slots__ = ('team', 'health', 'size', 'shells', 'mines', 'armor',
+                 'regen_timer')
+
     def __init__(self, x: float, y: float, team: Team = Team.NEUTRAL) -> None:
         super().__init__(x, y)
         self.team: Team = team
@@ -666,29 +1032,38 @@ class Base(Entity):
         self.team = new_team
         self.health = 8
     
+    # Cached sprites keyed by (team, supply indicator size)
+    _sprites: Dict[Tuple[Team, int], pygame.Surface] = {}
+
     def draw(self, surface: pygame.Surface, camera_offset: Position) -> None:
-        """Render the base."""
-        screen_x = int(self.x - camera_offset[0])
-        screen_y = int(self.y - camera_offset[1])
-        
-        color = TEAM_COLORS.get(self.team, (100, 100, 100))
-        
-        # Diamond shape for base
-        points = [
-            (screen_x, screen_y - self.size),
-            (screen_x + self.size, screen_y),
-            (screen_x, screen_y + self.size),
-            (screen_x - self.size, screen_y),
-        ]
-        pygame.draw.polygon(surface, color, points)
-        pygame.draw.polygon(surface, (40, 40, 40), points, 2)
-        
-        # Supply indicator in center
+        """Render the base (one blit of a cached sprite)."""
         supply_level = (self.shells + self.mines + self.armor) / 68  # Max total
         indicator_size = int(self.size * 0.5 * supply_level)
-        if indicator_size > 0:
-            pygame.draw.circle(surface, (200, 200, 200), 
-                             (screen_x, screen_y), indicator_size)
+
+        key = (self.team, indicator_size)
+        sprite = Base._sprites.get(key)
+        if sprite is None:
+            side = self.size * 2 + 1
+            sprite = pygame.Surface((side, side), pygame.SRCALPHA)
+            color = TEAM_COLOR_TABLE[self.team]
+            center = self.size
+            # Diamond shape for base
+            points = [
+                (center, center - self.size),
+                (center + self.size, center),
+                (center, center + self.size),
+                (center - self.size, center),
+            ]
+            pygame.draw.polygon(sprite, color, points)
+            pygame.draw.polygon(sprite, (40, 40, 40), points, 2)
+            if indicator_size > 0:
+                pygame.draw.circle(sprite, (200, 200, 200),
+                                 (center, center), indicator_size)
+            Base._sprites[key] = sprite
+
+        screen_x = int(self.x - camera_offset[0])
+        screen_y = int(self.y - camera_offset[1])
+        surface.blit(sprite, (screen_x - self.size, screen_y - self.size))
 
 
 # =============================================================================
@@ -706,14 +1081,22 @@ class GameMap:
     def __init__(self, width: int, height: int) -> None:
         self.width: int = width
         self.height: int = height
-        self.tiles: List[List[TileType]] = [
-            [TileType.GRASS for _ in range(width)] 
-            for _ in range(height)
-        ]
+        # Tiles live in one contiguous uint8 array (1 byte per tile
+        # instead of a Python object per tile). Indexing is a single
+        # C-level load, and bulk operations - generation, the terrain
+        # surface rebuild - become whole-array NumPy expressions.
+        # Indexed [y, x]; values are TileType ints.
+        self.tiles: np.ndarray = np.full(
+            (height, width), TileType.GRASS, dtype=np.uint8
+        )
         
-        # Cached terrain surface for efficient rendering
+        # Cached terrain surface for efficient rendering. _dirty forces
+        # a full rebuild (generation); point changes from set_tile go
+        # into _dirty_tiles and are patched individually, so a shell
+        # knocking out one wall repaints 16x16 pixels, not the map.
         self._terrain_surface: Optional[pygame.Surface] = None
         self._dirty: bool = True
+        self._dirty_tiles: Set[TileCoord] = set()
     
     @property
     def pixel_width(self) -> int:
@@ -726,14 +1109,15 @@ class GameMap:
     def get_tile(self, x: int, y: int) -> TileType:
         """Get tile type at grid coordinates."""
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.tiles[y][x]
+            # Cast the raw uint8 back to TileType at the API boundary
+            return TileType(self.tiles[y, x])
         return TileType.WALL  # Out of bounds treated as wall
-    
+
     def set_tile(self, x: int, y: int, tile_type: TileType) -> None:
         """Set tile type at grid coordinates."""
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.tiles[y][x] = tile_type
-            self._dirty = True
+            self.tiles[y, x] = tile_type
+            self._dirty_tiles.add((x, y))
     
     def damage_tile(self, x: int, y: int) -> None:
         """Apply damage to a tile (for destructible terrain)."""
@@ -750,42 +1134,43 @@ class GameMap:
     
     def generate_random(self) -> None:
         """Generate a random map for testing."""
-        for y in range(self.height):
-            for x in range(self.width):
-                # Border walls
-                if x == 0 or y == 0 or x == self.width - 1 or y == self.height - 1:
-                    self.tiles[y][x] = TileType.WALL
-                else:
-                    # Random terrain
-                    r = random.random()
-                    if r < 0.05:
-                        self.tiles[y][x] = TileType.FOREST
-                    elif r < 0.08:
-                        self.tiles[y][x] = TileType.RIVER
-                    elif r < 0.10:
-                        self.tiles[y][x] = TileType.SWAMP
-                    elif r < 0.12:
-                        self.tiles[y][x] = TileType.WALL
-                    else:
-                        self.tiles[y][x] = TileType.GRASS
-        
+        tiles = self.tiles
+
+        # Random terrain: draw one random field for the whole map, then
+        # apply the rarer types with masked writes. Writing in order of
+        # decreasing threshold lets each rarer band overwrite the last,
+        # matching the old per-tile if/elif chain.
+        r = np.random.random((self.height, self.width))
+        tiles[:] = TileType.GRASS
+        tiles[r < 0.12] = TileType.WALL
+        tiles[r < 0.10] = TileType.SWAMP
+        tiles[r < 0.08] = TileType.RIVER
+        tiles[r < 0.05] = TileType.FOREST
+
+        # Border walls
+        tiles[0, :] = TileType.WALL
+        tiles[-1, :] = TileType.WALL
+        tiles[:, 0] = TileType.WALL
+        tiles[:, -1] = TileType.WALL
+
         # Add some roads
         mid_y = self.height // 2
-        for x in range(5, self.width - 5):
-            self.tiles[mid_y][x] = TileType.ROAD
-        
+        tiles[mid_y, 5:self.width - 5] = TileType.ROAD
+
         mid_x = self.width // 2
-        for y in range(5, self.height - 5):
-            self.tiles[y][mid_x] = TileType.ROAD
-        
+        tiles[5:self.height - 5, mid_x] = TileType.ROAD
+
         self._dirty = True
     
     def render(self, surface: pygame.Surface, camera_offset: Position, 
                viewport_size: Tuple[int, int]) -> None:
         """Render visible portion of map to surface."""
-        # Rebuild cached surface if dirty
+        # Full rebuild only when the whole map changed (generation);
+        # individual tile changes just get patched in place
         if self._dirty or self._terrain_surface is None:
             self._rebuild_terrain_surface()
+        elif self._dirty_tiles:
+            self._patch_dirty_tiles()
         
         # Calculate visible tile range
         start_x = max(0, int(camera_offset[0] // Config.TILE_SIZE))
@@ -802,38 +1187,64 @@ class GameMap:
         surface.blit(self._terrain_surface, (0, 0), src_rect)
     
     def _rebuild_terrain_surface(self) -> None:
-        """Rebuild the cached terrain surface."""
-        self._terrain_surface = pygame.Surface(
-            (self.pixel_width, self.pixel_height)
-        )
-        
-        for y in range(self.height):
-            for x in range(self.width):
-                tile = self.tiles[y][x]
-                terrain = TERRAIN_DATA.get(tile, TERRAIN_DATA[TileType.GRASS])
-                
-                rect = pygame.Rect(
-                    x * Config.TILE_SIZE,
-                    y * Config.TILE_SIZE,
-                    Config.TILE_SIZE,
-                    Config.TILE_SIZE
-                )
-                pygame.draw.rect(self._terrain_surface, terrain.color, rect)
-                
-                # Add subtle grid lines
-                pygame.draw.rect(self._terrain_surface, 
-                               (terrain.color[0] - 10, 
-                                terrain.color[1] - 10, 
-                                terrain.color[2] - 10), 
-                               rect, 1)
-        
+        """
+        Rebuild the cached terrain surface.
+
+        Runs entirely in NumPy: index the color LUT by the tile array
+        to get one RGB value per tile, expand each tile to TILE_SIZE
+        pixels with np.repeat, overwrite the last pixel row/column of
+        every tile with the darker grid shade, and push the whole
+        image to the surface in a single blit_array call - no per-tile
+        Python dispatch or draw.rect round trips.
+        """
+        if self._terrain_surface is None:
+            self._terrain_surface = pygame.Surface(
+                (self.pixel_width, self.pixel_height)
+            )
+
+        ts = Config.TILE_SIZE
+        img = TERRAIN_COLOR_LUT[self.tiles]                 # (H, W, 3)
+        pix = np.repeat(np.repeat(img, ts, axis=0), ts, axis=1)
+
+        # Subtle grid lines along each tile's bottom/right pixel edge
+        grid = TERRAIN_GRID_LUT[self.tiles]
+        pix[ts - 1::ts, :, :] = np.repeat(grid, ts, axis=1)
+        pix[:, ts - 1::ts, :] = np.repeat(grid, ts, axis=0)
+
+        # surfarray expects (width, height, 3)
+        pygame.surfarray.blit_array(self._terrain_surface, pix.swapaxes(0, 1))
+
         self._dirty = False
+        self._dirty_tiles.clear()
+
+    def _patch_dirty_tiles(self) -> None:
+        """Repaint only the tiles changed since the last render."""
+        ts = Config.TILE_SIZE
+        surf = self._terrain_surface
+        for x, y in self._dirty_tiles:
+            tile = self.tiles[y, x]
+            color = TERRAIN_COLOR_LUT[tile]
+            grid = TERRAIN_GRID_LUT[tile]
+            px, py = x * ts, y * ts
+            surf.fill(color, (px, py, ts, ts))
+            # Keep the grid lines on the tile's bottom/right pixel edge
+            surf.fill(grid, (px, py + ts - 1, ts, 1))
+            surf.fill(grid, (px + ts - 1, py, 1, ts))
+        self._dirty_tiles.clear()
 
 
 # =============================================================================
 # SECTION 4: GAME STATE
 # =============================================================================
 
+# Cell size of the tank spatial hash. Matching PILLBOX_RANGE means a
+# pillbox only ever needs to look at its own cell and the 8 neighbors.
+TANK_GRID_CELL: int = int(Config.PILLBOX_RANGE)
+
+# Exponential camera-follow factor per frame (fraction of the gap to
+# the target position closed each frame)
+CAMERA_SMOOTHING: float = 0.1
+
 class GameState:
     """
     Central game state manager.
@@ -844,8 +1255,66 @@ class GameState:
     
     def __init__(self) -> None:
         self.game_map: GameMap = GameMap(Config.MAP_WIDTH, Config.MAP_HEIGHT)
-        self.entities: List[Entity] = []
+
+        # Camera constants - map and window sizes are immutable, so
+        # compute them once instead of per frame in _update_camera
+        self._cam_clamp_x: int = self.game_map.pixel_width - Config.WINDOW_WIDTH
+        self._cam_clamp_y: int = self.game_map.pixel_height - Config.WINDOW_HEIGHT
+        self._half_w: float = Config.WINDOW_WIDTH * 0.5
+        self._half_h: float = Config.WINDOW_HEIGHT * 0.5
+
+        # Entities are bucketed by type so the frame loop runs one
+        # homogeneous pass per kind (same code over the same layout)
+        # instead of dispatching a virtual update() per object. The
+        # `entities` property below chains them for callers that still
+        # want a flat view.
+        self.tanks: List[Tank] = []
+        self.pillboxes: List[Pillbox] = []
+        self.bases: List[Base] = []
+        self.mines: List[Mine] = []
         self.pending_entities: List[Entity] = []  # Added during update loop
+        self.shells: ShellPool = ShellPool()  # Shells live here, not in entities
+
+        # Spawn dispatch: exact type -> bucket, one dict lookup per
+        # insert instead of an isinstance chain
+        self._buckets: Dict[type, List[Entity]] = {
+            Tank: self.tanks,
+            Pillbox: self.pillboxes,
+            Base: self.bases,
+            Mine: self.mines,
+        }
+
+        # Buckets in draw order, sorted once by each class's
+        # RENDER_LAYER - the render pass just chains them
+        self.render_buckets: Tuple[List[Entity], ...] = tuple(
+            bucket for cls, bucket in
+            sorted(self._buckets.items(), key=lambda kv: kv[0].RENDER_LAYER)
+        )
+
+        # Spatial hash of live tanks, rebuilt once per frame; pillboxes
+        # (and later mines/bases) query it instead of scanning entities
+        self.tank_grid: Dict[TileCoord, List[Tank]] = {}
+
+        # Contiguous SoA mirror of the live tanks (positions + teams),
+        # refreshed once per frame. Vectorized passes - shell hits,
+        # resupply broadcasts - read these instead of walking objects.
+        # Row i corresponds to self.live_tanks[i].
+        self.live_tanks: List[Tank] = []
+        self.tank_xs: np.ndarray = np.empty(0, dtype=np.float32)
+        self.tank_ys: np.ndarray = np.empty(0, dtype=np.float32)
+        self.tank_teams: np.ndarray = np.empty(0, dtype=np.int16)
+        self.tank_ids: np.ndarray = np.empty(0, dtype=np.int64)
+
+        # Same mirror for live, active pillboxes. Pillboxes never move,
+        # so unlike the tank mirror this one is only rebuilt when
+        # flagged dirty (spawn, damage, capture, removal) - stationary
+        # entities shouldn't pay a per-frame rebuild. Row i corresponds
+        # to self.live_pillboxes[i].
+        self._pillbox_mirror_dirty: bool = True
+        self.live_pillboxes: List[Pillbox] = []
+        self.pillbox_xs: np.ndarray = np.empty(0, dtype=np.float32)
+        self.pillbox_ys: np.ndarray = np.empty(0, dtype=np.float32)
+        self.pillbox_teams: np.ndarray = np.empty(0, dtype=np.int16)
         
         # Player reference
         self.player: Optional[Tank] = None
@@ -858,28 +1327,122 @@ class GameState:
         self.paused: bool = False
         self.game_over: bool = False
         self.score: int = 0
+        self.frame_index: int = 0  # Simulation frames elapsed (drives timers)
     
+    @property
+    def entities(self) -> List[Entity]:
+        """Flat view over all bucketed entities (legacy callers only)."""
+        return [*self.tanks, *self.pillboxes, *self.bases, *self.mines]
+
     def add_entity(self, entity: Entity) -> None:
         """Add an entity to be spawned next frame."""
+        if isinstance(entity, Shell):
+            # Shells are folded into the SoA pool; the Shell object is
+            # only the spawn parameter carrier
+            self.shells.spawn(entity.x, entity.y, entity.angle,
+                              entity.team, entity.owner_id)
+            return
         self.pending_entities.append(entity)
-    
+
+    def _insert(self, entity: Entity) -> None:
+        """File a spawned entity into its type bucket."""
+        bucket = self._buckets.get(type(entity))
+        if bucket is None:
+            raise TypeError(f"No bucket for entity type {type(entity).__name__}")
+        bucket.append(entity)
+        if bucket is self.pillboxes:
+            self._pillbox_mirror_dirty = True
+
+    @staticmethod
+    def _compact_bucket(bucket: List[Entity]) -> bool:
+        """Remove dead entries in place via swap-and-pop.
+
+        Keeps the list object's identity (the spawn dispatch dict
+        aliases the buckets) and allocates nothing on frames where
+        nobody died. Returns True if anything was removed. Order within
+        the bucket is not preserved - nothing depends on it.
+        """
+        i = 0
+        n = len(bucket)
+        removed = False
+        while i < n:
+            if bucket[i].alive:
+                i += 1
+            else:
+                n -= 1
+                bucket[i] = bucket[n]
+                removed = True
+        del bucket[n:]
+        return removed
+
     def remove_dead_entities(self) -> None:
         """Clean up destroyed entities."""
-        self.entities = [e for e in self.entities if e.alive]
+        self._compact_bucket(self.tanks)
+        if self._compact_bucket(self.pillboxes):
+            self._pillbox_mirror_dirty = True
+        self._compact_bucket(self.bases)
+        self._compact_bucket(self.mines)
     
     def update(self) -> None:
         """Process one frame of game logic."""
         if self.paused or self.game_over:
             return
-        
+
+        self.frame_index += 1
+
         # Add pending entities
-        self.entities.extend(self.pending_entities)
+        for entity in self.pending_entities:
+            self._insert(entity)
         self.pending_entities.clear()
-        
-        # Update all entities
-        for entity in self.entities:
-            entity.update(self)
-        
+
+        # Rebuild the tank grid and the SoA mirror - one O(tanks) pass
+        # serving every spatial/vectorized query this frame
+        grid = self.tank_grid
+        grid.clear()
+        live = self.live_tanks
+        live.clear()
+        for tank in self.tanks:
+            if tank.alive:
+                live.append(tank)
+                cell = (int(tank.x) // TANK_GRID_CELL,
+                        int(tank.y) // TANK_GRID_CELL)
+                if cell in grid:
+                    grid[cell].append(tank)
+                else:
+                    grid[cell] = [tank]
+        n = len(live)
+        self.tank_xs = np.fromiter((t.x for t in live), np.float32, n)
+        self.tank_ys = np.fromiter((t.y for t in live), np.float32, n)
+        self.tank_teams = np.fromiter((t.team for t in live), np.int16, n)
+        self.tank_ids = np.fromiter((t.id for t in live), np.int64, n)
+
+        if self._pillbox_mirror_dirty:
+            self._pillbox_mirror_dirty = False
+            live_p = self.live_pillboxes
+            live_p.clear()
+            for pillbox in self.pillboxes:
+                if pillbox.alive and pillbox.active:
+                    live_p.append(pillbox)
+            m = len(live_p)
+            self.pillbox_xs = np.fromiter((p.x for p in live_p), np.float32, m)
+            self.pillbox_ys = np.fromiter((p.y for p in live_p), np.float32, m)
+            self.pillbox_teams = np.fromiter((p.team for p in live_p),
+                                             np.int16, m)
+
+        # Update entities in typed passes - each loop runs identical
+        # code over a homogeneous list
+        for tank in self.tanks:
+            tank.update(self)
+        for pillbox in self.pillboxes:
+            pillbox.update(self)
+        for base in self.bases:
+            base.update(self)
+        for mine in self.mines:
+            mine.update(self)
+
+        # Advance the shell pool (batched over all shells)
+        self.shells.update(self.game_map)
+
         # Process collisions
         self._process_collisions()
         
@@ -892,81 +1455,158 @@ class GameState:
     
     def _process_collisions(self) -> None:
         """Handle entity collisions."""
-        # Shell vs Tank
-        for entity in self.entities:
-            if isinstance(entity, Shell) and entity.alive:
-                for other in self.entities:
-                    if isinstance(other, Tank) and other.alive:
-                        if other.id == entity.owner_id:
-                            continue  # Can't shoot yourself
-                        if other.team == entity.team:
-                            continue  # Team damage off (configurable)
-                        
-                        dist = math.sqrt((entity.x - other.x)**2 + 
-                                        (entity.y - other.y)**2)
-                        if dist < other.size + entity.radius:
-                            other.take_damage(entity.damage)
-                            entity.destroy()
-                            break
-        
-        # Shell vs Pillbox
-        for entity in self.entities:
-            if isinstance(entity, Shell) and entity.alive:
-                for other in self.entities:
-                    if isinstance(other, Pillbox) and other.alive and other.active:
-                        if other.team == entity.team:
+        # Shell vs Tank / Pillbox: one (shells x targets) broadcast per
+        # target class over the SoA mirrors - every tank shares
+        # Config.TANK_SIZE and every pillbox its class size, so a single
+        # scalar radius covers each pass. argwhere walks pairs in
+        # shell-major order; the dead set keeps each shell to one hit.
+        pool = self.shells
+        n = pool.count
+        if n:
+            sx = pool.x[:n]
+            sy = pool.y[:n]
+            steam = pool.team[:n]
+            sowner = pool.owner_id[:n]
+            dead_shells: Set[int] = set()
+
+            if self.live_tanks:
+                r = Config.TANK_SIZE + pool.radius
+                if first_hit_per_shell is not None:
+                    hit = np.full(n, -1, dtype=np.int64)
+                    first_hit_per_shell(sx, sy, steam, sowner,
+                                        self.tank_xs, self.tank_ys,
+                                        self.tank_teams, self.tank_ids,
+                                        r, hit)
+                    for si in np.nonzero(hit >= 0)[0]:
+                        si = int(si)
+                        dead_shells.add(si)
+                        self.live_tanks[int(hit[si])].take_damage(pool.damage)
+                else:
+                    dx = sx[:, None] - self.tank_xs[None, :]
+                    dy = sy[:, None] - self.tank_ys[None, :]
+                    hits = (dx * dx + dy * dy < r * r)
+                    hits &= (steam[:, None] != self.tank_teams[None, :])
+                    hits &= (sowner[:, None] != self.tank_ids[None, :])
+                    for si, ti in np.argwhere(hits):
+                        si = int(si)
+                        if si not in dead_shells:
+                            dead_shells.add(si)
+                            self.live_tanks[int(ti)].take_damage(pool.damage)
+
+            if self.live_pillboxes:
+                r = self.live_pillboxes[0].size + pool.radius
+                if first_hit_per_shell is not None:
+                    hit = np.full(n, -1, dtype=np.int64)
+                    # Pillboxes have no owners; -1 never matches a shell
+                    no_owner = np.full(len(self.live_pillboxes), -1,
+                                       dtype=np.int64)
+                    first_hit_per_shell(sx, sy, steam, sowner,
+                                        self.pillbox_xs, self.pillbox_ys,
+                                        self.pillbox_teams, no_owner,
+                                        r, hit)
+                    for si in np.nonzero(hit >= 0)[0]:
+                        si = int(si)
+                        if si not in dead_shells:
+                            dead_shells.add(si)
+                            self.live_pillboxes[int(hit[si])].take_damage(
+                                pool.damage)
+                            self._pillbox_mirror_dirty = True
+                else:
+                    dx = sx[:, None] - self.pillbox_xs[None, :]
+                    dy = sy[:, None] - self.pillbox_ys[None, :]
+                    hits = (dx * dx + dy * dy < r * r)
+                    hits &= (steam[:, None] != self.pillbox_teams[None, :])
+                    for si, pi in np.argwhere(hits):
+                        si = int(si)
+                        if si not in dead_shells:
+                            dead_shells.add(si)
+                            self.live_pillboxes[int(pi)].take_damage(pool.damage)
+                            self._pillbox_mirror_dirty = True
+
+            pool.kill(dead_shells)
+
+        # Tank vs Mine: query the tank spatial hash around each mine
+        # rather than scanning every tank - a mine's trigger radius is
+        # far smaller than a grid cell, so its own cell plus neighbors
+        # is always sufficient
+        grid = self.tank_grid
+        grid_get = grid.get
+        for mine in self.mines:
+            if not mine.alive:
+                continue
+            # Bind the mine's fields once - the nested cell loops would
+            # otherwise re-run these LOAD_ATTRs per candidate tank
+            mx = mine.x
+            my = mine.y
+            mteam = mine.team
+            mradius = mine.radius
+            cx = int(mx) // TANK_GRID_CELL
+            cy = int(my) // TANK_GRID_CELL
+            for gx in (cx - 1, cx, cx + 1):
+                for gy in (cy - 1, cy, cy + 1):
+                    for other in grid_get((gx, gy), ()):
+                        if other.team == mteam:
                             continue
-                        
-                        dist = math.sqrt((entity.x - other.x)**2 + 
-                                        (entity.y - other.y)**2)
-                        if dist < other.size + entity.radius:
-                            other.take_damage(entity.damage)
-                            entity.destroy()
-                            break
-        
-        # Tank vs Mine
-        for entity in self.entities:
-            if isinstance(entity, Mine) and entity.alive:
-                for other in self.entities:
-                    if isinstance(other, Tank) and other.alive:
-                        if other.team == entity.team:
+                        r = other.size + mradius
+                        dx = mx - other.x
+                        if dx > r or dx < -r:
                             continue
-                        
-                        dist = math.sqrt((entity.x - other.x)**2 + 
-                                        (entity.y - other.y)**2)
-                        if dist < other.size + entity.radius:
-                            other.take_damage(entity.damage)
-                            entity.detonate(self)
+                        dy = my - other.y
+                        if dy > r or dy < -r:
+                            continue
+                        if dx * dx + dy * dy < r * r:
+                            other.take_damage(mine.damage)
+                            mine.detonate(self)
                             break
-        
-        # Tank vs Base (for resupply/capture)
-        for entity in self.entities:
-            if isinstance(entity, Tank) and entity.alive:
-                for other in self.entities:
-                    if isinstance(other, Base):
-                        dist = math.sqrt((entity.x - other.x)**2 + 
-                                        (entity.y - other.y)**2)
-                        if dist < entity.size + other.size:
-                            if other.team == entity.team:
-                                other.resupply_tank(entity)
-                            elif other.team == Team.NEUTRAL:
-                                other.capture(entity.team)
+                    else:
+                        continue
+                    break
+                else:
+                    continue
+                break
+
+        # Tank vs Base (for resupply/capture): one broadcast distance
+        # test per base against the tank SoA mirror, then scalar
+        # resupply/capture only on the matched tanks
+        if self.live_tanks:
+            xs = self.tank_xs
+            ys = self.tank_ys
+            for other in self.bases:
+                # All tanks share Config.TANK_SIZE, so one radius works
+                r = Config.TANK_SIZE + other.size
+                dx = xs - other.x
+                dy = ys - other.y
+                for i in np.nonzero(dx * dx + dy * dy < r * r)[0]:
+                    tank = self.live_tanks[int(i)]
+                    if other.team == tank.team:
+                        other.resupply_tank(tank)
+                    elif other.team == Team.NEUTRAL:
+                        other.capture(tank.team)
     
     def _update_camera(self) -> None:
         """Center camera on player."""
         if self.player:
-            target_x = self.player.x - Config.WINDOW_WIDTH // 2
-            target_y = self.player.y - Config.WINDOW_HEIGHT // 2
-            
+            target_x = self.player.x - self._half_w
+            target_y = self.player.y - self._half_h
+
             # Smooth camera movement
-            self.camera_x += (target_x - self.camera_x) * 0.1
-            self.camera_y += (target_y - self.camera_y) * 0.1
-            
-            # Clamp to map bounds
-            self.camera_x = max(0, min(self.game_map.pixel_width - Config.WINDOW_WIDTH, 
-                                      self.camera_x))
-            self.camera_y = max(0, min(self.game_map.pixel_height - Config.WINDOW_HEIGHT, 
-                                      self.camera_y))
+            cx = self.camera_x + (target_x - self.camera_x) * CAMERA_SMOOTHING
+            cy = self.camera_y + (target_y - self.camera_y) * CAMERA_SMOOTHING
+
+            # Clamp to map bounds (limits precomputed in __init__).
+            # Explicit branches beat min/max calls here: mid-map the
+            # camera never saturates, so both branches predict
+            # not-taken and no function call is made.
+            if cx < 0:
+                cx = 0.0
+            elif cx > self._cam_clamp_x:
+                cx = float(self._cam_clamp_x)
+            if cy < 0:
+                cy = 0.0
+            elif cy > self._cam_clamp_y:
+                cy = float(self._cam_clamp_y)
+            self.camera_x = cx
+            self.camera_y = cy
     
     @property
     def camera_offset(self) -> Position:
@@ -977,6 +1617,34 @@ class GameState:
 # SECTION 5: MAIN GAME CLASS
 # =============================================================================
 
+# Enemy AI steering thresholds, hoisted so the per-tank hot path does
+# no radians conversions or multiplies
+AI_AIM_TOLERANCE: float = math.radians(5)   # Close enough to stop turning
+AI_FIRE_CONE: float = math.radians(30)      # Facing window for move/fire
+AI_APPROACH_DIST_SQ: int = 150 * 150        # Advance while farther than this
+AI_FIRE_DIST_SQ: int = 300 * 300            # Fire while closer than this
+TWO_PI: float = 2 * math.pi
+
+# Movement keys packed for bitmask dispatch: scancodes hoisted out of
+# the per-frame path, two key bits per action so WASD and the arrows
+# collapse into one test each
+MOVE_KEYS: Tuple[int, ...] = (
+    pygame.K_w, pygame.K_UP,       # bits 0-1: forward
+    pygame.K_s, pygame.K_DOWN,     # bits 2-3: backward
+    pygame.K_a, pygame.K_LEFT,     # bits 4-5: rotate left
+    pygame.K_d, pygame.K_RIGHT,    # bits 6-7: rotate right
+)
+FORWARD_BITS: int = 0b00000011
+BACKWARD_BITS: int = 0b00001100
+LEFT_BITS: int = 0b00110000
+RIGHT_BITS: int = 0b11000000
+
+# Viewport cull margin: generous bound on the largest sprite
+# half-extent (tank hull + cannon), so center-point culling never
+# drops a partially visible entity
+CULL_MARGIN: int = 48
+
+
 class BoloGame:
     """
     Main game controller.
@@ -986,7 +1654,11 @@ class BoloGame:
     """
     
     def __init__(self) -> None:
-        pygame.init()
+        # Init only the subsystems in use - pygame.init() would also
+        # bring up audio/joystick, which this game never touches and
+        # which dominate startup time
+        pygame.display.init()
+        pygame.font.init()
         pygame.display.set_caption("bring-back-BOLO")
         
         self.screen: pygame.Surface = pygame.display.set_mode(
@@ -997,48 +1669,63 @@ class BoloGame:
         
         self.game_state: GameState = GameState()
         self.font: pygame.font.Font = pygame.font.Font(None, 24)
-        
+
+        # Static UI surfaces, rendered once - font rendering and
+        # Surface allocation are too heavy for the per-frame path
+        self._overlay: pygame.Surface = pygame.Surface(
+            (Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT)
+        )
+        self._overlay.set_alpha(128)
+        self._overlay.fill((0, 0, 0))
+        font_large = pygame.font.Font(None, 72)
+        self._game_over_surf = font_large.render("GAME OVER", True, (255, 50, 50))
+        self._restart_surf = self.font.render("Press R to Restart", True,
+                                              (255, 255, 255))
+        self._pause_surf = self.font.render("PAUSED - Press ESC to Continue",
+                                            True, (255, 255, 0))
+        self._controls_surf = self.font.render(
+            "WASD: Move | SPACE: Fire | M: Mine | ESC: Pause | R: Restart",
+            True, (200, 200, 200)
+        )
+
+        # HUD resource line, re-rendered only when the numbers change
+        self._hud_key: Optional[Tuple[int, int, int, int]] = None
+        self._hud_surf: Optional[pygame.Surface] = None
+
         self._setup_game()
     
     def _setup_game(self) -> None:
         """Initialize game objects for a new game."""
         # Generate map
         self.game_state.game_map.generate_random()
-        
+
+        # Map pixel dimensions, computed once for all the spawns below
+        pw = self.game_state.game_map.pixel_width
+        ph = self.game_state.game_map.pixel_height
+
         # Spawn player
-        player = Tank(
-            Config.MAP_WIDTH * Config.TILE_SIZE // 4,
-            Config.MAP_HEIGHT * Config.TILE_SIZE // 2,
-            Team.TEAM_1
-        )
+        player = Tank(pw // 4, ph // 2, Team.TEAM_1)
         self.game_state.player = player
-        self.game_state.entities.append(player)
-        
+        self.game_state.tanks.append(player)
+
         # Spawn some enemies
         for i in range(3):
-            enemy = Tank(
-                Config.MAP_WIDTH * Config.TILE_SIZE * 3 // 4,
-                Config.MAP_HEIGHT * Config.TILE_SIZE // 4 + i * 100,
-                Team.TEAM_2
-            )
+            enemy = Tank(pw * 3 // 4, ph // 4 + i * 100, Team.TEAM_2)
             enemy.angle = 180  # Face left
-            self.game_state.entities.append(enemy)
-        
+            # Stagger the first AI shots so enemies don't volley
+            enemy.next_ai_fire_frame = random.randint(20, 60)
+            self.game_state.tanks.append(enemy)
+
         # Spawn bases
         base1 = Base(200, 200, Team.TEAM_1)
-        base2 = Base(Config.MAP_WIDTH * Config.TILE_SIZE - 200, 200, Team.TEAM_2)
-        base_neutral = Base(Config.MAP_WIDTH * Config.TILE_SIZE // 2, 
-                           Config.MAP_HEIGHT * Config.TILE_SIZE // 2)
-        self.game_state.entities.extend([base1, base2, base_neutral])
-        
+        base2 = Base(pw - 200, 200, Team.TEAM_2)
+        base_neutral = Base(pw // 2, ph // 2)
+        self.game_state.bases.extend([base1, base2, base_neutral])
+
         # Spawn pillboxes
         for i in range(4):
-            pill = Pillbox(
-                150 + i * 200,
-                Config.MAP_HEIGHT * Config.TILE_SIZE - 150,
-                Team.NEUTRAL
-            )
-            self.game_state.entities.append(pill)
+            pill = Pillbox(150 + i * 200, ph - 150, Team.NEUTRAL)
+            self.game_state.pillboxes.append(pill)
     
     def run(self) -> None:
         """Main game loop."""
@@ -1096,22 +1783,27 @@ class BoloGame:
         
         player = self.game_state.player
         if player and player.alive:
-            # Continuous key input
+            # Continuous key input, packed into one bitmask so each
+            # action is a single AND test instead of two keymap reads
             keys = pygame.key.get_pressed()
-            
-            if keys[pygame.K_w] or keys[pygame.K_UP]:
+            mask = 0
+            for i, key in enumerate(MOVE_KEYS):
+                if keys[key]:
+                    mask |= 1 << i
+
+            if mask & FORWARD_BITS:
                 player.move_forward(self.game_state)
-            if keys[pygame.K_s] or keys[pygame.K_DOWN]:
+            if mask & BACKWARD_BITS:
                 player.move_backward(self.game_state)
-            if keys[pygame.K_a] or keys[pygame.K_LEFT]:
+            if mask & LEFT_BITS:
                 player.rotate_left()
-            if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
+            if mask & RIGHT_BITS:
                 player.rotate_right()
         
         # Simple enemy AI
-        for entity in self.game_state.entities:
-            if isinstance(entity, Tank) and entity.team == Team.TEAM_2:
-                self._simple_enemy_ai(entity)
+        for tank in self.game_state.tanks:
+            if tank.team == Team.TEAM_2:
+                self._simple_enemy_ai(tank)
         
         self.game_state.update()
     
@@ -1121,25 +1813,34 @@ class BoloGame:
         if not player or not player.alive:
             return
         
-        # Calculate angle to player
+        # Angle to player, worked entirely in radians (no degrees
+        # round-trip), normalized to [-pi, pi)
         dx = player.x - enemy.x
         dy = player.y - enemy.y
-        target_angle = math.degrees(math.atan2(dy, dx))
-        
+        angle_diff = math.atan2(dy, dx) - math.radians(enemy.angle)
+        angle_diff = (angle_diff + math.pi) % TWO_PI - math.pi
+
         # Rotate towards player
-        angle_diff = (target_angle - enemy.angle + 180) % 360 - 180
-        if abs(angle_diff) > 5:
+        if abs(angle_diff) > AI_AIM_TOLERANCE:
             if angle_diff > 0:
                 enemy.rotate_right()
             else:
                 enemy.rotate_left()
-        
-        # Move and shoot if facing player
-        dist = math.sqrt(dx*dx + dy*dy)
-        if abs(angle_diff) < 30:
-            if dist > 150:
+
+        # Move and shoot if facing player (squared distances - the
+        # actual distance is never needed, only threshold comparisons).
+        # Firing runs on a per-enemy frame schedule: one randint at
+        # fire time (mean gap 35 frames, matching the old 3%-per-frame
+        # roll) instead of an RNG call per enemy per frame.
+        dist_sq = dx*dx + dy*dy
+        if abs(angle_diff) < AI_FIRE_CONE:
+            if dist_sq > AI_APPROACH_DIST_SQ:
                 enemy.move_forward(self.game_state)
-            if dist < 300 and random.random() < 0.03:
+            if (dist_sq < AI_FIRE_DIST_SQ and
+                    self.game_state.frame_index >= enemy.next_ai_fire_frame):
+                enemy.next_ai_fire_frame = (
+                    self.game_state.frame_index + random.randint(20, 50)
+                )
                 shell = enemy.fire(self.game_state)
                 if shell:
                     self.game_state.add_entity(shell)
@@ -1156,11 +1857,27 @@ class BoloGame:
             (Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT)
         )
         
-        # Render entities (sorted by type for proper layering)
-        for entity in sorted(self.game_state.entities, 
-                           key=lambda e: (isinstance(e, Tank), isinstance(e, Shell))):
-            entity.draw(self.screen, self.game_state.camera_offset)
-        
+        # Render entities in RENDER_LAYER order straight from the type
+        # buckets - no per-frame sort, no isinstance key. Entities
+        # outside the camera viewport are culled before their draw
+        # call; the margin covers the largest sprite half-extent so
+        # nothing pops at the edges.
+        gs = self.game_state
+        offset = gs.camera_offset
+        vx0 = offset[0] - CULL_MARGIN
+        vy0 = offset[1] - CULL_MARGIN
+        vx1 = offset[0] + Config.WINDOW_WIDTH + CULL_MARGIN
+        vy1 = offset[1] + Config.WINDOW_HEIGHT + CULL_MARGIN
+        screen = self.screen
+        for entity in itertools.chain(*gs.render_buckets):
+            x = entity.x
+            y = entity.y
+            if vx0 <= x <= vx1 and vy0 <= y <= vy1:
+                entity.draw(screen, offset)
+
+        # Shells render on top, straight from the pool
+        self.game_state.shells.draw(self.screen, self.game_state.camera_offset)
+
         # Render UI
         self._render_ui()
         
@@ -1172,52 +1889,50 @@ class BoloGame:
         if not player:
             return
         
-        # Resource display (only show if player is alive)
+        # Resource display (only show if player is alive). The text
+        # surface is cached and only re-rendered when a resource count
+        # actually changes.
         if player.alive:
-            ui_text = (
-                f"Armor: {player.resources.armor}/{Config.TANK_MAX_ARMOR}  "
-                f"Shells: {player.resources.shells}/{Config.TANK_MAX_SHELLS}  "
-                f"Mines: {player.resources.mines}/{Config.TANK_MAX_MINES}  "
-                f"Wood: {player.resources.wood}/{Config.TANK_MAX_WOOD}"
-            )
-            text_surface = self.font.render(ui_text, True, (255, 255, 255))
-            self.screen.blit(text_surface, (10, 10))
-        
+            res = player.resources
+            hud_key = (res.armor, res.shells, res.mines, res.wood)
+            if hud_key != self._hud_key:
+                self._hud_key = hud_key
+                ui_text = (
+                    f"Armor: {res.armor}/{Config.TANK_MAX_ARMOR}  "
+                    f"Shells: {res.shells}/{Config.TANK_MAX_SHELLS}  "
+                    f"Mines: {res.mines}/{Config.TANK_MAX_MINES}  "
+                    f"Wood: {res.wood}/{Config.TANK_MAX_WOOD}"
+                )
+                self._hud_surf = self.font.render(ui_text, True, (255, 255, 255))
+            if self._hud_surf is not None:
+                self.screen.blit(self._hud_surf, (10, 10))
+
         # Controls hint
-        controls = "WASD: Move | SPACE: Fire | M: Mine | ESC: Pause | R: Restart"
-        controls_surface = self.font.render(controls, True, (200, 200, 200))
-        self.screen.blit(controls_surface, (10, Config.WINDOW_HEIGHT - 30))
-        
+        self.screen.blit(self._controls_surf, (10, Config.WINDOW_HEIGHT - 30))
+
         # Game Over overlay (when player is dead)
         if not player.alive:
             # Semi-transparent overlay
-            overlay = pygame.Surface((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT))
-            overlay.set_alpha(128)
-            overlay.fill((0, 0, 0))
-            self.screen.blit(overlay, (0, 0))
-            
+            self.screen.blit(self._overlay, (0, 0))
+
             # Game Over text
-            game_over_font = pygame.font.Font(None, 72)
-            game_over_text = game_over_font.render("GAME OVER", True, (255, 50, 50))
-            game_over_rect = game_over_text.get_rect(
+            game_over_rect = self._game_over_surf.get_rect(
                 center=(Config.WINDOW_WIDTH // 2, Config.WINDOW_HEIGHT // 2 - 40)
             )
-            self.screen.blit(game_over_text, game_over_rect)
-            
+            self.screen.blit(self._game_over_surf, game_over_rect)
+
             # Restart instruction
-            restart_text = self.font.render("Press R to Restart", True, (255, 255, 255))
-            restart_rect = restart_text.get_rect(
+            restart_rect = self._restart_surf.get_rect(
                 center=(Config.WINDOW_WIDTH // 2, Config.WINDOW_HEIGHT // 2 + 20)
             )
-            self.screen.blit(restart_text, restart_rect)
+            self.screen.blit(self._restart_surf, restart_rect)
         
         # Pause overlay (when game is paused and player is alive)
         elif self.game_state.paused:
-            pause_text = self.font.render("PAUSED - Press ESC to Continue", True, (255, 255, 0))
-            pause_rect = pause_text.get_rect(
+            pause_rect = self._pause_surf.get_rect(
                 center=(Config.WINDOW_WIDTH // 2, Config.WINDOW_HEIGHT // 2)
             )
-            self.screen.blit(pause_text, pause_rect)
+            self.screen.blit(self._pause_surf, pause_rect)
 
 
 # =============================================================================
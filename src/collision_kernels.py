@@ -0,0 +1,56 @@
+"""
+bring-back-BOLO: Collision Broad-Phase Kernels
+===============================================
+Numba-compiled inner loops for the shell collision broad phase.
+
+After the SoA conversion the broad phase is a tight numeric loop over
+contiguous position/team arrays - ideal JIT material. When numba is
+installed, `first_hit_per_shell` runs as LLVM-compiled machine code and
+replaces the (shells x targets) NumPy broadcast in
+`GameState._process_collisions`, avoiding the intermediate boolean
+matrices entirely. When it is not, the module exports ``None`` and the
+engine keeps its vectorized NumPy path.
+
+Author: Code the Dream / StrayDog Syndications
+License: MIT
+"""
+
+from __future__ import annotations
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+if numba is not None:
+
+    # No cache=True: the on-disk cache pickles the module name it was
+    # compiled under, and this file is importable both as
+    # src.collision_kernels (package) and collision_kernels (the
+    # engine's standalone fallback) - a cache written under one name
+    # raises ModuleNotFoundError when loaded under the other.
+    @numba.njit(fastmath=True)
+    def first_hit_per_shell(sx, sy, steam, sowner,
+                            tx, ty, tteam, tid,
+                            radius, out_hit):  # pragma: no cover - JIT
+        """Write the first target index each shell hits into out_hit.
+
+        Targets on the shell's team or owned by the shell's firer are
+        skipped (pass tid filled with -1 when owners can never match,
+        e.g. pillboxes). out_hit must be pre-filled with -1; entries
+        left at -1 mean the shell hit nothing.
+        """
+        r_sq = radius * radius
+        for i in range(sx.shape[0]):
+            for j in range(tx.shape[0]):
+                if steam[i] == tteam[j] or sowner[i] == tid[j]:
+                    continue
+                dx = sx[i] - tx[j]
+                dy = sy[i] - ty[j]
+                if dx * dx + dy * dy < r_sq:
+                    out_hit[i] = j
+                    break
+
+else:
+    first_hit_per_shell = None
@@ -5,62 +5,117 @@ This module defines the Entity base class that all game objects
 (tanks, shells, mines, pillboxes, bases, LGM) inherit from.
 """
 from __future__ import annotations
-from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Tuple
+from typing import TYPE_CHECKING, ClassVar, Iterator, Tuple
+import itertools
 import math
 
-import pygame
+from src.config import DISPLAY
 
 if TYPE_CHECKING:
+    import pygame
+
     from src.game import GameState
 
 # Type aliases
 Position = Tuple[float, float]
 TileCoord = Tuple[int, int]
 
+# Tile size bound at import - tile_position runs on per-frame paths,
+# so it shouldn't pay a module-dict plus attribute lookup per call.
+# When the size is a power of two (16 here), the floor-division
+# becomes a right shift.
+_TILE_SIZE: int = DISPLAY.TILE_SIZE
+_TILE_SHIFT: int | None = (
+    _TILE_SIZE.bit_length() - 1
+    if _TILE_SIZE & (_TILE_SIZE - 1) == 0 else None
+)
+
+
+def _distance(x1: float, y1: float, x2: float, y2: float) -> float:
+    """Euclidean distance between two points (pure-Python fallback)."""
+    return math.hypot(x2 - x1, y2 - y1)
+
+
+def _distance_sq(x1: float, y1: float, x2: float, y2: float) -> float:
+    """Squared distance between two points (pure-Python fallback)."""
+    dx = x2 - x1
+    dy = y2 - y1
+    return dx * dx + dy * dy
+
 
-@dataclass
-class Entity(ABC):
+def _step_towards(x: float, y: float, tx: float, ty: float,
+                  speed: float) -> Tuple[float, float]:
+    """One movement step from (x, y) towards (tx, ty) at speed."""
+    dx = tx - x
+    dy = ty - y
+    dist = math.hypot(dx, dy)
+    if dist == 0.0:
+        return (x, y)
+    scale = speed / dist
+    return (x + dx * scale, y + dy * scale)
+
+
+# When the optional Cython extension (src/_math_fast.pyx) has been
+# compiled in place, its typed C versions replace the fallbacks above
+try:
+    from src._math_fast import (  # type: ignore[no-redef]  # noqa: F811
+        distance as _distance,
+        distance_sq as _distance_sq,
+        step_towards as _step_towards,
+    )
+except ImportError:
+    pass
+
+
+class Entity:
     """
     Base class for all game entities.
-    
-    Uses dataclass for clean initialization while maintaining
-    abstract method requirements. All game objects (tanks, shells,
-    structures, etc.) inherit from this class.
-    
+
+    All game objects (tanks, shells, structures, etc.) inherit from
+    this class and must override update() and draw(); the base
+    implementations raise NotImplementedError. A plain hand-built
+    class rather than an ABC or a dataclass: ABCMeta slows isinstance
+    checks, and the dataclass field machinery (__dataclass_fields__,
+    generated methods) bought nothing here once __init__, __repr__,
+    __eq__, and __hash__ were all written by hand anyway.
+
+    Slotted: entities are created by the thousands, and dropping the
+    per-instance __dict__ shrinks each one and speeds up the attribute
+    reads that dominate the frame loop. Subclasses must declare
+    __slots__ too (empty tuple if they add no fields) to keep the
+    benefit. __init__ is positional-only: the spawn loop is hot, and
+    four direct assignments beat generated-initializer defaults
+    handling and kwargs support.
+
     Attributes:
         x: World X coordinate in pixels
         y: World Y coordinate in pixels
         alive: Whether entity is active (False triggers removal)
-        
+
     The _id field is automatically generated and provides unique
     identification for each entity instance.
     """
-    x: float
-    y: float
-    _id: int = field(default_factory=lambda: Entity._generate_id(), init=False)
-    alive: bool = field(default=True, init=False)
-    
-    # Class variable for ID generation
-    _next_id: int = 0
-    
-    @classmethod
-    def _generate_id(cls) -> int:
-        """
-        Generate unique entity ID.
-        
-        Returns:
-            Monotonically increasing integer ID.
-        """
-        current = cls._next_id
-        cls._next_id += 1
-        return current
-    
+
+    __slots__ = ('x', 'y', '_id', 'alive')
+
+    # Positional patterns: case Entity(x, y) - the dataclass used to
+    # generate this from its fields
+    __match_args__ = ('x', 'y')
+
+    # Monotonic ID stream; count.__next__ is a single C-level call,
+    # cheaper than a Python classmethod doing read-increment-write
+    _id_iter: ClassVar[Iterator[int]] = itertools.count()
+
+    def __init__(self, x: float, y: float, /) -> None:
+        self.x = x
+        self.y = y
+        self._id = next(Entity._id_iter)
+        self.alive = True
+
     @classmethod
     def reset_id_counter(cls) -> None:
         """Reset ID counter (useful for testing)."""
-        cls._next_id = 0
+        cls._id_iter = itertools.count()
     
     @property
     def id(self) -> int:
@@ -88,40 +143,45 @@ class Entity(ABC):
         Returns:
             (tile_x, tile_y) tuple of grid coordinates.
         """
-        from src.config import DISPLAY
+        if _TILE_SHIFT is not None:
+            # floor before shifting: int() truncates toward zero, which
+            # would map slightly-negative coordinates (off the map
+            # edge) to tile 0 instead of -1
+            return (
+                math.floor(self.x) >> _TILE_SHIFT,
+                math.floor(self.y) >> _TILE_SHIFT,
+            )
         return (
-            int(self.x // DISPLAY.TILE_SIZE),
-            int(self.y // DISPLAY.TILE_SIZE)
+            int(self.x // _TILE_SIZE),
+            int(self.y // _TILE_SIZE)
         )
     
-    @abstractmethod
     def update(self, game_state: GameState, dt: float) -> None:
         """
         Update entity state.
-        
+
         Called once per frame to update entity logic, movement,
         timers, etc. Subclasses must implement this method.
-        
+
         Args:
             game_state: Current game state for context (map, other entities, etc.)
             dt: Delta time in seconds (for framerate independence).
                  At 60 FPS, dt ≈ 0.0167 seconds.
         """
-        pass
-    
-    @abstractmethod
+        raise NotImplementedError
+
     def draw(self, surface: pygame.Surface, camera_offset: Position) -> None:
         """
         Render entity to surface.
-        
+
         Called once per frame to draw the entity. The camera_offset
         should be subtracted from entity position to get screen coordinates.
-        
+
         Args:
             surface: Pygame surface to draw on (usually the main screen).
             camera_offset: Current camera position (cam_x, cam_y) for scrolling.
         """
-        pass
+        raise NotImplementedError
     
     def destroy(self) -> None:
         """
@@ -135,22 +195,50 @@ class Entity(ABC):
     def distance_to(self, other: Entity | Position) -> float:
         """
         Calculate distance to another entity or position.
-        
+
         Uses Pythagorean theorem: distance = sqrt((x2-x1)² + (y2-y1)²)
-        
+
+        Convenience dispatcher; hot loops that know their argument
+        type should call distance_to_entity or distance_to_point
+        directly and skip the isinstance check.
+
         Args:
             other: Another Entity or a (x, y) position tuple.
-        
+
         Returns:
             Distance in pixels.
         """
         if isinstance(other, Entity):
-            other_x, other_y = other.x, other.y
-        else:
-            other_x, other_y = other
-        
-        return math.sqrt((self.x - other_x)**2 + (self.y - other_y)**2)
-    
+            return self.distance_to_entity(other)
+        return self.distance_to_point(other)
+
+    def distance_to_entity(self, other: Entity) -> float:
+        """Distance to another entity (no type dispatch)."""
+        return _distance(self.x, self.y, other.x, other.y)
+
+    def distance_to_point(self, point: Position) -> float:
+        """Distance to an (x, y) position tuple (no type dispatch)."""
+        return _distance(self.x, self.y, point[0], point[1])
+
+    def distance_sq_to(self, other: Entity | Position) -> float:
+        """
+        Calculate squared distance to another entity or position.
+
+        Prefer this for range/threshold checks: compare against the
+        squared radius (d_sq < r * r) and the sqrt in distance_to is
+        never needed.
+
+        Args:
+            other: Another Entity or a (x, y) position tuple.
+
+        Returns:
+            Squared distance in pixels squared.
+        """
+        if isinstance(other, Entity):
+            return _distance_sq(self.x, self.y, other.x, other.y)
+        return _distance_sq(self.x, self.y, other[0], other[1])
+
+
     def angle_to(self, other: Entity | Position) -> float:
         """
         Calculate angle from this entity to another entity or position.
@@ -161,45 +249,72 @@ class Entity(ABC):
         Args:
             other: Another Entity or a (x, y) position tuple.
         
+        Convenience dispatcher; hot loops that know their argument
+        type should call angle_to_entity or angle_to_point directly.
+
         Returns:
             Angle in degrees (0-360).
         """
         if isinstance(other, Entity):
-            other_x, other_y = other.x, other.y
-        else:
-            other_x, other_y = other
-        
-        dx = other_x - self.x
-        dy = other_y - self.y
-        angle_rad = math.atan2(dy, dx)
-        angle_deg = math.degrees(angle_rad)
-        
-        # Normalize to 0-360
-        return angle_deg % 360
+            return self.angle_to_entity(other)
+        return self.angle_to_point(other)
+
+    def angle_to_entity(self, other: Entity) -> float:
+        """Angle in degrees (0-360) towards another entity."""
+        # degrees(atan2(...)) is already within [-180, 180], so one
+        # compare+add normalizes - no float modulo needed
+        angle_deg = math.degrees(
+            math.atan2(other.y - self.y, other.x - self.x)
+        )
+        return angle_deg + 360.0 if angle_deg < 0.0 else angle_deg
+
+    def angle_to_point(self, point: Position) -> float:
+        """Angle in degrees (0-360) towards an (x, y) position."""
+        angle_deg = math.degrees(
+            math.atan2(point[1] - self.y, point[0] - self.x)
+        )
+        return angle_deg + 360.0 if angle_deg < 0.0 else angle_deg
+
+    def angle_rad_to_entity(self, other: Entity) -> float:
+        """Raw atan2 angle in radians (-pi to pi) towards another entity.
+
+        Preferred for internal math - feeding cos/sin needs no
+        normalization or degrees round-trip.
+        """
+        return math.atan2(other.y - self.y, other.x - self.x)
+
+    def angle_rad_to_point(self, point: Position) -> float:
+        """Raw atan2 angle in radians (-pi to pi) towards a position."""
+        return math.atan2(point[1] - self.y, point[0] - self.x)
     
     def move_towards(self, target: Position, speed: float) -> None:
         """
         Move entity towards a target position at given speed.
-        
-        Useful for AI movement and homing projectiles.
-        
+
+        Useful for AI movement and homing projectiles. Steps along the
+        direct-normalized delta vector - one hypot instead of the
+        atan2/degrees/radians/cos/sin chain an angle round-trip would
+        cost (angle_to remains available for callers that need the
+        heading itself).
+
         Args:
             target: Target (x, y) position.
             speed: Movement speed in pixels per frame.
         """
-        angle = self.angle_to(target)
-        angle_rad = math.radians(angle)
-        
-        self.x += math.cos(angle_rad) * speed
-        self.y += math.sin(angle_rad) * speed
+        self.x, self.y = _step_towards(self.x, self.y,
+                                       target[0], target[1], speed)
     
     def is_on_screen(self, camera_offset: Position, screen_size: Tuple[int, int], margin: int = 50) -> bool:
         """
         Check if entity is visible on screen.
-        
+
         Useful for culling off-screen entities from rendering.
         Adds a margin to account for entity size.
-        
+
+        For whole-population culling, use
+        src.systems.render_cull.cull_visible on the SoA position
+        arrays instead of calling this per entity.
+
         Args:
             camera_offset: Current camera (x, y) position.
             screen_size: Screen (width, height) in pixels.
@@ -219,16 +334,31 @@ class Entity(ABC):
             -margin <= screen_y <= screen_h + margin
         )
     
-    def __repr__(self) -> str:
-        """String representation for debugging."""
-        return f"{self.__class__.__name__}(id={self.id}, pos=({self.x:.1f}, {self.y:.1f}), alive={self.alive})"
-    
+    if __debug__:
+        def __repr__(self) -> str:
+            """String representation for debugging.
+
+            Defined only in debug runs; under python -O the default
+            object repr is enough and the string formatting never
+            ships on logging-heavy paths.
+            """
+            return f"{self.__class__.__name__}(id={self.id}, pos=({self.x:.1f}, {self.y:.1f}), alive={self.alive})"
+
+
     def __eq__(self, other: object) -> bool:
-        """Equality based on entity ID."""
-        if not isinstance(other, Entity):
+        """
+        Equality based on entity ID.
+
+        Reads other._id directly and treats its absence as "not an
+        Entity" - set and dict operations on entities are frequent
+        enough that the isinstance check is worth skipping on the
+        common both-are-entities path.
+        """
+        try:
+            return self._id == other._id  # type: ignore[attr-defined]
+        except AttributeError:
             return NotImplemented
-        return self.id == other.id
-    
+
     def __hash__(self) -> int:
         """Hash based on entity ID (allows use in sets/dicts)."""
-        return hash(self.id)
+        return self._id
@@ -4,7 +4,7 @@ Game enumerations for type safety and clarity.
 This module defines all enum types used throughout the game,
 providing type-safe constants and clear intent.
 """
-from enum import IntEnum, auto
+from enum import IntEnum
 
 
 class TileType(IntEnum):
@@ -46,11 +46,14 @@ class GamePhase(IntEnum):
     Game state machine phases.
     
     Controls high-level game flow and input handling.
+
+    Values are explicit and dense from zero so they can index
+    dispatch tables (handler lists) directly.
     """
-    MENU = auto()       # Main menu, settings, map selection
-    PLAYING = auto()    # Active gameplay
-    PAUSED = auto()     # Game paused (ESC)
-    GAME_OVER = auto()  # Player defeated
+    MENU = 0       # Main menu, settings, map selection
+    PLAYING = 1    # Active gameplay
+    PAUSED = 2     # Game paused (ESC)
+    GAME_OVER = 3  # Player defeated
 
 
 class EntityType(IntEnum):
@@ -58,28 +61,30 @@ class EntityType(IntEnum):
     Entity classification for collision layers.
     
     Used for efficient collision detection via
-    spatial partitioning and layer filtering.
+    spatial partitioning and layer filtering. Zero-based dense values
+    index per-type handler lists without a dict lookup.
     """
-    TANK = auto()
-    SHELL = auto()
-    MINE = auto()
-    PILLBOX = auto()
-    BASE = auto()
-    LGM = auto()       # Little Green Man (engineer)
+    TANK = 0
+    SHELL = 1
+    MINE = 2
+    PILLBOX = 3
+    BASE = 4
+    LGM = 5       # Little Green Man (engineer)
 
 
 class AIState(IntEnum):
     """
     AI behavior states for enemy tanks.
     
-    State machine controls enemy tank decision-making.
+    State machine controls enemy tank decision-making. Zero-based
+    dense values index transition tables directly.
     """
-    IDLE = auto()      # Waiting, no targets
-    PATROL = auto()    # Random movement
-    CHASE = auto()     # Moving toward enemy
-    ATTACK = auto()    # Firing at target
-    FLEE = auto()      # Low health retreat
-    CAPTURE = auto()   # Moving to capture objective
+    IDLE = 0      # Waiting, no targets
+    PATROL = 1    # Random movement
+    CHASE = 2     # Moving toward enemy
+    ATTACK = 3    # Firing at target
+    FLEE = 4      # Low health retreat
+    CAPTURE = 5   # Moving to capture objective
 
 
 class LGMTask(IntEnum):
@@ -87,13 +92,25 @@ class LGMTask(IntEnum):
     LGM (engineer) task types.
     
     Defines what action the deployed engineer is performing.
+    Zero-based dense values index per-task handler lists directly.
     """
-    IDLE = auto()          # No current task
-    HARVEST = auto()       # Getting wood from forest
-    BUILD_ROAD = auto()    # Constructing road tile
-    BUILD_WALL = auto()    # Constructing wall tile
-    BUILD_BOAT = auto()    # Building boat for deep water
-    PLACE_MINE = auto()    # Placing visible mine
-    DRILL_MINE = auto()    # Placing hidden mine
-    CAPTURE_PILL = auto()  # Capturing pillbox
-    PLACE_PILL = auto()    # Deploying pillbox
+    IDLE = 0          # No current task
+    HARVEST = 1       # Getting wood from forest
+    BUILD_ROAD = 2    # Constructing road tile
+    BUILD_WALL = 3    # Constructing wall tile
+    BUILD_BOAT = 4    # Building boat for deep water
+    PLACE_MINE = 5    # Placing visible mine
+    DRILL_MINE = 6    # Placing hidden mine
+    CAPTURE_PILL = 7  # Capturing pillbox
+    PLACE_PILL = 8    # Deploying pillbox
+
+
+# Bare-int aliases for the tile types touched in inner loops (map
+# rendering, movement, collision). Comparing against a plain int skips
+# the IntEnum.__eq__ machinery; keep the enums themselves for API
+# boundaries and serialization.
+TILE_DEEP_WATER: int = TileType.DEEP_WATER.value
+TILE_ROAD: int = TileType.ROAD.value
+TILE_FOREST: int = TileType.FOREST.value
+TILE_GRASS: int = TileType.GRASS.value
+TILE_WALL: int = TileType.WALL.value
@@ -1,5 +1,10 @@
 """Game systems for collision, combat, resources, and AI."""
 
+from .batch_update import BatchUpdater, update_each
+from .pool import EntityPool
+from .render_cull import cull_visible
+from .spatial import angles_from, distances_from, distances_sq_from
+
 # Systems will be imported here as they are created
 # from .collision import CollisionSystem
 # from .combat import CombatSystem
@@ -7,6 +12,13 @@
 # from .ai import AISystem, TankAI
 
 __all__ = [
+    "BatchUpdater",
+    "EntityPool",
+    "update_each",
+    "angles_from",
+    "cull_visible",
+    "distances_from",
+    "distances_sq_from",
     # "CollisionSystem",
     # "CombatSystem",
     # "ResourceSystem",
@@ -0,0 +1,107 @@
+"""
+Object pool for short-lived entities.
+
+Shells, mines, and particles are created and destroyed continuously;
+each construction runs the dataclass __init__ and id generation, and
+each death leaves garbage for the collector. An EntityPool converts
+that churn into O(1) field writes: instances are pre-allocated once,
+"freed" entities are recycled via a reset() call instead of a fresh
+__init__, and the update loop iterates only the in-use list.
+
+Pooled entity classes must provide a ``reset(x, y, **kwargs)`` method
+that reinitializes all per-spawn state in place.
+"""
+from __future__ import annotations
+from typing import Callable, Generic, Iterator, List, TypeVar
+
+from src.entities.base_entity import Entity
+
+T = TypeVar("T", bound=Entity)
+
+
+class EntityPool(Generic[T]):
+    """
+    Fixed-type pool of recyclable entities.
+
+    Entities are handed out by acquire(), which reuses a free instance
+    when one is available and only constructs when the pool is empty.
+    Dead entities (alive == False) are reclaimed by sweep() rather
+    than discarded, so steady-state frames allocate nothing.
+
+    Attributes:
+        factory: Zero-argument callable producing a fresh instance
+                 (used for pre-allocation and growth).
+    """
+
+    def __init__(self, factory: Callable[[], T], prealloc: int = 0) -> None:
+        """
+        Create a pool.
+
+        Args:
+            factory: Callable returning a new, not-yet-live instance.
+            prealloc: Number of instances to construct up front so the
+                      first frames of play never allocate.
+        """
+        self.factory: Callable[[], T] = factory
+        self._free: List[T] = [factory() for _ in range(prealloc)]
+        self._in_use: List[T] = []
+
+    def __len__(self) -> int:
+        """Number of live (in-use) entities."""
+        return len(self._in_use)
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate the live entities only (the update-loop view)."""
+        return iter(self._in_use)
+
+    def acquire(self, x: float, y: float, **kwargs: object) -> T:
+        """
+        Obtain a live entity, recycling a freed one when possible.
+
+        Calls reset(x, y, **kwargs) on the instance instead of
+        __init__, marks it alive, and tracks it as in use.
+
+        Args:
+            x: Spawn world X coordinate.
+            y: Spawn world Y coordinate.
+            **kwargs: Forwarded to the entity's reset() method.
+
+        Returns:
+            A live, reinitialized entity.
+        """
+        if self._free:
+            entity = self._free.pop()
+        else:
+            entity = self.factory()
+        entity.reset(x, y, **kwargs)  # type: ignore[attr-defined]
+        entity.alive = True
+        self._in_use.append(entity)
+        return entity
+
+    def sweep(self) -> None:
+        """
+        Reclaim dead entities back into the free list.
+
+        Compacts the in-use list in place with swap-and-pop, so frames
+        where nothing died cost one pass and zero allocation. Call once
+        per frame after updates and collisions have run.
+        """
+        in_use = self._in_use
+        i = 0
+        n = len(in_use)
+        while i < n:
+            entity = in_use[i]
+            if entity.alive:
+                i += 1
+            else:
+                n -= 1
+                in_use[i] = in_use[n]
+                self._free.append(entity)
+        del in_use[n:]
+
+    def clear(self) -> None:
+        """Kill and reclaim every live entity (e.g. on game restart)."""
+        for entity in self._in_use:
+            entity.alive = False
+            self._free.append(entity)
+        self._in_use.clear()
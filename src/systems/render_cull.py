@@ -0,0 +1,44 @@
+"""
+Vectorized viewport culling.
+
+Entity.is_on_screen answers one entity per call through six Python
+comparisons; asked of every entity every frame, the interpreter
+overhead dwarfs the arithmetic. cull_visible computes the same test
+for the whole population as one boolean broadcast over the SoA
+position arrays - the render loop calls it once, then draws only the
+True-indexed entities.
+"""
+from __future__ import annotations
+from typing import Tuple
+
+import numpy as np
+
+
+def cull_visible(xs: np.ndarray, ys: np.ndarray,
+                 camera_offset: Tuple[float, float],
+                 screen_size: Tuple[int, int],
+                 margin: int = 50) -> np.ndarray:
+    """
+    Visibility mask for every position against the camera viewport.
+
+    Mirrors Entity.is_on_screen: a position is visible when it lies
+    within the screen rectangle expanded by margin on all sides.
+
+    Args:
+        xs: Entity X coordinates, shape (n,).
+        ys: Entity Y coordinates, shape (n,).
+        camera_offset: Current camera (x, y) position.
+        screen_size: Screen (width, height) in pixels.
+        margin: Extra pixels around the screen edge to consider
+                visible (covers sprite half-extents).
+
+    Returns:
+        Boolean array, shape (n,); True where the entity should be
+        drawn.
+    """
+    cam_x, cam_y = camera_offset
+    screen_w, screen_h = screen_size
+    sx = xs - cam_x
+    sy = ys - cam_y
+    return ((sx >= -margin) & (sx <= screen_w + margin) &
+            (sy >= -margin) & (sy <= screen_h + margin))
@@ -0,0 +1,73 @@
+"""
+Vectorized spatial queries over SoA position arrays.
+
+The per-entity helpers on Entity (distance_to, angle_to) read Python
+floats one object at a time; fine for a single query, hostile to the
+cache when run across every entity every frame. These functions take
+structure-of-arrays inputs - parallel float32 arrays of x and y, one
+row per live entity, as maintained by the game state - and answer the
+whole population in one C-level pass each.
+
+Row order is the caller's contract: index i in the input arrays must
+correspond to index i in whatever back-reference list maps results to
+entity objects.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+
+def distances_from(xs: np.ndarray, ys: np.ndarray,
+                   x: float, y: float) -> np.ndarray:
+    """
+    Distance from the point (x, y) to every position.
+
+    Args:
+        xs: Entity X coordinates, shape (n,).
+        ys: Entity Y coordinates, shape (n,).
+        x: Query point X.
+        y: Query point Y.
+
+    Returns:
+        Float array of distances, shape (n,).
+    """
+    return np.hypot(xs - x, ys - y)
+
+
+def distances_sq_from(xs: np.ndarray, ys: np.ndarray,
+                      x: float, y: float) -> np.ndarray:
+    """
+    Squared distance from (x, y) to every position.
+
+    Prefer this over distances_from for threshold tests (compare
+    against radius**2) - it skips the square root entirely.
+
+    Args:
+        xs: Entity X coordinates, shape (n,).
+        ys: Entity Y coordinates, shape (n,).
+        x: Query point X.
+        y: Query point Y.
+
+    Returns:
+        Float array of squared distances, shape (n,).
+    """
+    dx = xs - x
+    dy = ys - y
+    return dx * dx + dy * dy
+
+
+def angles_from(xs: np.ndarray, ys: np.ndarray,
+                x: float, y: float) -> np.ndarray:
+    """
+    Angle in radians from (x, y) towards every position.
+
+    Args:
+        xs: Entity X coordinates, shape (n,).
+        ys: Entity Y coordinates, shape (n,).
+        x: Query point X.
+        y: Query point Y.
+
+    Returns:
+        Float array of angles in radians (-pi to pi), shape (n,).
+    """
+    return np.arctan2(ys - y, xs - x)